@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -38,7 +38,8 @@ def record_operation(
     )
     ledger_path.parent.mkdir(parents=True, exist_ok=True)
     with open(ledger_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(asdict(entry)) + "\n")
+        # BudgetEntry is all flat str fields; asdict's recursive copy buys nothing.
+        f.write(json.dumps(vars(entry)) + "\n")
     return entry
 
 
@@ -22,7 +22,6 @@ from driftdriver.speedriftd_state import (
 )
 from driftdriver.cli.debate_cmd import register_debate_parser
 from driftdriver.cli.graph_dir_cmd import register_graph_dir_parser
-from driftdriver.workgraph import find_workgraph_dir
 
 # -- Re-export everything that was previously importable from driftdriver.cli --
 
@@ -59,6 +58,7 @@ from ._helpers import (
     _compute_loop_safety,
     _dedupe_strings,
     _ensure_update_followup_task,
+    _find_wg_dir,
     _maybe_auto_ensure_contracts,
     _normalize_actions,
     _parse_watch_repo,
@@ -482,7 +482,7 @@ def cmd_run_validation_gates(args: argparse.Namespace) -> int:
     from driftdriver.directives import DirectiveLog
     from driftdriver.validation_gates import check_validation_gates
 
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
+    wg_dir = _find_wg_dir(args.dir)
     log = DirectiveLog(wg_dir / "service" / "directives")
 
     # Load the task via wg show --json
@@ -543,7 +543,7 @@ def cmd_decompose(args: argparse.Namespace) -> int:
     from driftdriver.decompose import decompose_goal
     from driftdriver.directives import DirectiveLog
 
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
+    wg_dir = _find_wg_dir(args.dir)
     log = DirectiveLog(wg_dir / "service" / "directives")
     result = decompose_goal(
         goal=args.goal,
@@ -574,7 +574,7 @@ def cmd_reaper(args: argparse.Namespace) -> int:
     from driftdriver.reaper import reap_zombies, read_reaper_status
 
     project_dir = Path(args.dir) if args.dir else Path.cwd()
-    wg_dir = find_workgraph_dir(project_dir) or (project_dir / ".workgraph")
+    wg_dir = _find_wg_dir(project_dir) or (project_dir / ".workgraph")
     action = args.action
     use_json = getattr(args, "json", False)
 
@@ -609,7 +609,7 @@ def cmd_llm_spend(args: argparse.Namespace) -> int:
     """Query LLM spend log."""
     from driftdriver.llm_meter import query_spend
 
-    wg_dir = find_workgraph_dir(Path(args.dir) if getattr(args, "dir", None) else None)
+    wg_dir = _find_wg_dir(getattr(args, "dir", None))
     log_path = wg_dir / "llm-spend.jsonl" if wg_dir else Path(".workgraph/llm-spend.jsonl")
 
     tail_hours = float(getattr(args, "tail", "24h").rstrip("h"))
@@ -663,7 +663,7 @@ def cmd_watchdog(args: argparse.Namespace) -> int:
     """Run one spend watchdog check cycle."""
     from driftdriver.spend_watchdog import run_watchdog
 
-    wg_dir = find_workgraph_dir(Path(args.dir) if getattr(args, "dir", None) else None)
+    wg_dir = _find_wg_dir(getattr(args, "dir", None))
     if wg_dir is None:
         wg_dir = Path(".workgraph")
 
@@ -704,7 +704,7 @@ def cmd_watchdog(args: argparse.Namespace) -> int:
 # ---------------------------------------------------------------------------
 
 def cmd_speedriftd(args: argparse.Namespace) -> int:
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
+    wg_dir = _find_wg_dir(args.dir)
     project_dir = wg_dir.parent
     from driftdriver.policy import load_drift_policy
     policy = load_drift_policy(wg_dir)
@@ -1015,12 +1015,59 @@ def cmd_health_workers_cli(args: argparse.Namespace) -> int:
 # Argparse setup
 # ---------------------------------------------------------------------------
 
-def _build_parser() -> argparse.ArgumentParser:
+class _SkippedParser:
+    """Stand-in for subcommands that are not selected on this invocation."""
+
+    def __getattr__(self, name: str) -> Any:
+        return self._noop
+
+    def _noop(self, *args: Any, **kwargs: Any) -> Any:
+        return self
+
+    def add_parser(self, *args: Any, **kwargs: Any) -> "_SkippedParser":
+        return self
+
+
+class _SelectedSubparsers:
+    """Subparsers proxy that only builds the parser for one command name."""
+
+    def __init__(self, sub: Any, only: str) -> None:
+        self._sub = sub
+        self._only = only
+        self.matched = False
+
+    def add_parser(self, name: str, **kwargs: Any) -> Any:
+        if name != self._only and self._only not in kwargs.get("aliases", ()):
+            return _SkippedParser()
+        self.matched = True
+        return self._sub.add_parser(name, **kwargs)
+
+
+_GLOBAL_VALUE_FLAGS = frozenset({"--dir"})
+
+
+def _peek_command(argv: list[str]) -> str | None:
+    it = iter(argv)
+    for tok in it:
+        if tok in _GLOBAL_VALUE_FLAGS:
+            next(it, None)
+            continue
+        if tok.startswith("-"):
+            if tok in ("-h", "--help"):
+                return None
+            continue
+        return tok
+    return None
+
+
+def _build_parser(only: str | None = None) -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="driftdriver")
     p.add_argument("--dir", help="Project directory (or .workgraph dir). Defaults to cwd search.")
     p.add_argument("--json", action="store_true", help="JSON output (where supported)")
 
-    sub = p.add_subparsers(dest="cmd", required=True)
+    sub: Any = p.add_subparsers(dest="cmd", required=True)
+    if only is not None:
+        sub = _SelectedSubparsers(sub, only)
 
     install = sub.add_parser("install", help="Install Driftdriver into a workgraph repo")
     install.add_argument("--coredrift-bin", help="Path to coredrift bin/coredrift (required if not discoverable)")
@@ -1538,6 +1585,8 @@ def _build_parser() -> argparse.ArgumentParser:
     upgrade_p.add_argument("--root", default=None, help="Root dir for --fleet (default: cwd)")
     upgrade_p.set_defaults(func=cmd_upgrade)
 
+    if only is not None and not sub.matched:
+        return _build_parser()
     return p
 
 
@@ -1551,7 +1600,7 @@ def main(argv: list[str] | None = None) -> int:
             wire_idx = -1
         if wire_idx != -1:
             forwarded = forwarded[:wire_idx] + forwarded[wire_idx + 1:]
-    p = _build_parser()
+    p = _build_parser(_peek_command(forwarded))
     args = p.parse_args(forwarded)
     return int(args.func(args))
 
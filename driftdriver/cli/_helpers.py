@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 import subprocess
 import sys
@@ -18,13 +20,70 @@ from driftdriver.health import (
     rank_ready_drift_queue,
     redrift_depth,
 )
+from driftdriver.policy import DriftPolicy, load_drift_policy
 from driftdriver.updates import (
     ECOSYSTEM_REPOS,
     check_ecosystem_updates,
     load_review_config,
     summarize_updates,
 )
-from driftdriver.workgraph import load_workgraph
+from driftdriver.workgraph import Workgraph, find_workgraph_dir, load_workgraph
+
+
+@functools.lru_cache(maxsize=16)
+def _find_workgraph_dir_cached(explicit: str | None, cwd: str) -> Path:
+    return find_workgraph_dir(Path(explicit) if explicit else None)
+
+
+def _find_wg_dir(explicit: str | Path | None) -> Path:
+    """Memoized ``find_workgraph_dir`` for repeated CLI invocations in one process.
+
+    Keyed on the string form of ``--dir`` plus the current working directory, so
+    implicit (cwd-based) lookups stay correct if the process changes directory.
+    Failed lookups raise and are not cached; a cached dir whose graph.jsonl has
+    gone away is looked up afresh. Call ``_find_workgraph_dir_cached.cache_clear()``
+    after initializing a new workgraph so a nearer one wins over a cached parent.
+    """
+    key = (str(explicit) if explicit else None, os.getcwd())
+    wg_dir = _find_workgraph_dir_cached(*key)
+    if not (wg_dir / "graph.jsonl").exists():
+        _find_workgraph_dir_cached.cache_clear()
+        wg_dir = _find_workgraph_dir_cached(*key)
+    return wg_dir
+
+
+@functools.lru_cache(maxsize=4)
+def _load_workgraph_snapshot(wg_dir: str, mtime_ns: int, size: int) -> Workgraph:
+    return load_workgraph(Path(wg_dir))
+
+
+def _load_wg_cached(wg_dir: Path) -> Workgraph:
+    """``load_workgraph`` memoized on graph.jsonl's (mtime_ns, size).
+
+    One ``cmd_check``/``cmd_run`` parses the graph several times; the stat key
+    reuses the parse until the file changes. Callers must treat the result as
+    read-only since it is shared.
+    """
+    st = (wg_dir / "graph.jsonl").stat()
+    return _load_workgraph_snapshot(str(wg_dir), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_policy_snapshot(wg_dir: str, mtime_ns: int, size: int) -> DriftPolicy:
+    return load_drift_policy(Path(wg_dir))
+
+
+def _load_policy_cached(wg_dir: Path) -> DriftPolicy:
+    """``load_drift_policy`` memoized on drift-policy.toml's (mtime_ns, size).
+
+    A missing policy file keys as (0, -1) so the defaults are built once.
+    Callers must treat the result as read-only since it is shared.
+    """
+    try:
+        st = (wg_dir / "drift-policy.toml").stat()
+    except FileNotFoundError:
+        return _load_policy_snapshot(str(wg_dir), 0, -1)
+    return _load_policy_snapshot(str(wg_dir), st.st_mtime_ns, st.st_size)
 
 
 def _update_errors(result: dict[str, Any]) -> list[str]:
@@ -348,7 +407,7 @@ def _compute_loop_safety(*, wg_dir: Path, task_id: str, policy: Any) -> dict[str
     Budget/queue gating is handled by authority budgets in drift_task_guard.
     This function only blocks on structural graph problems.
     """
-    wg = load_workgraph(wg_dir)
+    wg = _load_wg_cached(wg_dir)
     tasks = list(wg.tasks.values())
     tasks_by_id = {str(t.get("id") or ""): t for t in tasks}
 
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib
 import json
 import os
@@ -12,7 +13,10 @@ import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    import asyncio
 
 from driftdriver.health import (
     blockers_done,
@@ -26,7 +30,6 @@ from driftdriver.health import (
     rank_ready_drift_queue,
     redrift_depth,
 )
-from driftdriver.policy import load_drift_policy
 from driftdriver.policy_enforcement import SEVERITY_RANK, collect_enforcement_findings, evaluate_enforcement
 from driftdriver.routing_models import rule_based_routing
 from driftdriver.smart_routing import gather_evidence
@@ -38,13 +41,16 @@ from driftdriver.updates import (
     render_review_markdown,
     summarize_updates,
 )
-from driftdriver.workgraph import find_workgraph_dir, load_workgraph
 
 from ._helpers import (
     _collect_findings,
     _compute_loop_safety,
     _dedupe_strings,
     _ensure_update_followup_task,
+    _find_wg_dir,
+    _find_workgraph_dir_cached,
+    _load_policy_cached,
+    _load_wg_cached,
     _maybe_auto_ensure_contracts,
     _normalize_actions,
     _parse_watch_repo,
@@ -108,6 +114,30 @@ OPTIONAL_PLUGINS = [
     "redrift",
 ]
 
+# Shared (read-only) stand-in for plugins that did not run.
+_PLUGIN_FALLBACK: dict[str, Any] = {"ran": False, "exit_code": 0, "report": None}
+
+# Plugins without standardized JSON output; their report is replaced by a note.
+_NOTE_ONLY_PLUGINS = frozenset({"uxdrift"})
+
+
+def _project_plugin_result(plugin: str, result: dict[str, Any] | None) -> dict[str, Any]:
+    """Project a raw plugin/lane result into the combined ``plugins`` JSON shape."""
+    if result is None:
+        result = _PLUGIN_FALLBACK
+    if plugin in _NOTE_ONLY_PLUGINS:
+        return {
+            "ran": bool(result.get("ran")),
+            "exit_code": int(result.get("exit_code", 0)),
+            "note": "no standardized json output yet",
+        }
+    return {
+        "ran": bool(result.get("ran")),
+        "exit_code": int(result.get("exit_code", 0)),
+        "report": result.get("report"),
+    }
+
+
 INTERNAL_LANES: dict[str, str] = {
     "qadrift": "driftdriver.qadrift",
     "secdrift": "driftdriver.secdrift",
@@ -161,10 +191,11 @@ def _ensure_wg_init(project_dir: Path) -> None:
         ["wg", "--dir", str(wg_dir), "init", "--model", "claude:opus"],
         cwd=str(project_dir),
     )
+    _find_workgraph_dir_cached.cache_clear()
 
 
 def _load_task(*, wg_dir: Path, task_id: str) -> dict[str, Any] | None:
-    wg = load_workgraph(wg_dir)
+    wg = _load_wg_cached(wg_dir)
     return wg.tasks.get(task_id)
 
 
@@ -175,6 +206,26 @@ def _task_has_fence(*, task: dict[str, Any] | None, fence: str) -> bool:
     return f"```{fence}" in desc
 
 
+@functools.lru_cache(maxsize=8)
+def _fence_pattern(candidates: frozenset[str]) -> re.Pattern[str]:
+    # Longest names first so a fence that extends another still matches in full.
+    names = sorted(candidates, key=len, reverse=True)
+    return re.compile("```(" + "|".join(re.escape(n) for n in names) + ")")
+
+
+def _task_fences(*, task: dict[str, Any] | None, candidates: Iterable[str]) -> set[str]:
+    """Return the ``candidates`` whose fence opens in the task description (one regex pass)."""
+    if not task:
+        return set()
+    desc = str(task.get("description") or "")
+    if "```" not in desc:
+        return set()
+    wanted = frozenset(candidates)
+    if not wanted:
+        return set()
+    return set(_fence_pattern(wanted).findall(desc))
+
+
 def _ordered_optional_plugins(policy_order: list[str]) -> list[str]:
     ordered: list[str] = []
     seen: set[str] = set()
@@ -215,6 +266,17 @@ def _task_text(task: dict[str, Any] | None) -> str:
     return f"{title}\n{tags_text}\n{desc}".lower()
 
 
+def _first_hits(needles: tuple[str, ...], text: str, limit: int = 3) -> list[str]:
+    """Return up to ``limit`` needles found in ``text``, stopping once the cap is hit."""
+    hits: list[str] = []
+    for needle in needles:
+        if needle in text:
+            hits.append(needle)
+            if len(hits) >= limit:
+                break
+    return hits
+
+
 def _should_run_full_suite(*, task: dict[str, Any] | None) -> tuple[bool, list[str]]:
     if not task:
         return (False, [])
@@ -223,11 +285,11 @@ def _should_run_full_suite(*, task: dict[str, Any] | None) -> tuple[bool, list[s
     desc = str(task.get("description") or "")
     text = _task_text(task)
 
-    for fence in sorted(FULL_SUITE_TRIGGER_FENCES):
-        if _task_has_fence(task=task, fence=fence):
-            reasons.append(f"{fence} fence declared")
+    trigger_fences = _task_fences(task=task, candidates=FULL_SUITE_TRIGGER_FENCES)
+    for fence in sorted(trigger_fences):
+        reasons.append(f"{fence} fence declared")
 
-    phrase_hits = [p for p in FULL_SUITE_TRIGGER_PHRASES if p in text]
+    phrase_hits = _first_hits(FULL_SUITE_TRIGGER_PHRASES, text)
     if phrase_hits:
         reasons.append(f"explicit full-suite intent ({', '.join(phrase_hits[:3])})")
 
@@ -247,14 +309,14 @@ def _should_run_full_suite(*, task: dict[str, Any] | None) -> tuple[bool, list[s
         complexity_points += 1
         reasons.append(f"wg-contract max_loc={max_loc}")
 
-    keyword_hits = [kw for kw in COMPLEXITY_KEYWORDS if kw in text]
+    keyword_hits = _first_hits(COMPLEXITY_KEYWORDS, text)
     if len(keyword_hits) >= 2:
         complexity_points += 1
         reasons.append(f"complexity keywords ({', '.join(keyword_hits[:3])})")
 
     if phrase_hits:
         return (True, reasons)
-    if any(_task_has_fence(task=task, fence=f) for f in FULL_SUITE_TRIGGER_FENCES):
+    if trigger_fences:
         return (True, reasons)
     if complexity_points >= 2:
         return (True, reasons)
@@ -291,8 +353,9 @@ def _select_optional_plugins(
 
     selected: set[str] = set()
     plugin_reasons: dict[str, str] = {}
+    fenced = _task_fences(task=task, candidates=ordered_plugins)
     for plugin in ordered_plugins:
-        if _task_has_fence(task=task, fence=plugin):
+        if plugin in fenced:
             selected.add(plugin)
             plugin_reasons[plugin] = "task fence"
 
@@ -381,7 +444,19 @@ def _create_followups_from_findings(
         )
 
 
-def _run_optional_plugin_json(
+# Characters of optional-plugin stderr kept in the combined error report.
+_PLUGIN_STDERR_LIMIT = 4000
+
+def _present_wrappers(wg_dir: Path) -> frozenset[str]:
+    """Names of regular files directly under ``wg_dir``, from one directory scan."""
+    try:
+        with os.scandir(wg_dir) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
+
+
+def _optional_plugin_cmd(
     *,
     plugin: str,
     enabled: bool,
@@ -390,33 +465,63 @@ def _run_optional_plugin_json(
     task_id: str,
     mode: str,
     force_write_log: bool,
-    force_create_followups: bool,
-) -> dict[str, Any]:
-    plugin_bin = wg_dir / plugin
-    if not plugin_bin.exists():
-        return {"ran": False, "exit_code": 0, "report": None}
+    want_json: bool,
+    present: frozenset[str] | None = None,
+) -> list[str] | None:
+    """Build the command for an optional plugin, or None if it should not run.
+
+    ``present`` is the result of :func:`_present_wrappers` when the caller has
+    already scanned ``wg_dir``; otherwise the wrapper is checked directly.
+    """
     if not enabled:
-        return {"ran": False, "exit_code": 0, "report": None}
+        return None
+    plugin_bin = wg_dir / plugin
+    if present is not None:
+        if plugin not in present:
+            return None
+    elif not os.path.isfile(plugin_bin):
+        return None
 
-    write_log, create_followups = _mode_flags(mode=mode, plugin=plugin)
+    write_log, _create_followups = _mode_flags(mode=mode, plugin=plugin)
     write_log = write_log or force_write_log
-    create_followups = create_followups or force_create_followups
-    cmd = _plugin_cmd(
+    return _plugin_cmd(
         plugin=plugin,
         plugin_bin=plugin_bin,
         project_dir=project_dir,
         task_id=task_id,
-        want_json=True,
+        want_json=want_json,
         write_log=write_log,
     )
-    proc = subprocess.run(cmd, text=True, capture_output=True)
+
+
+def _parse_plugin_stdout(stdout: str | None) -> Any:
+    """Decode a plugin's JSON stdout; empty output is ``{}``, anything else non-JSON is kept raw."""
+    if not stdout:
+        return {}
+    if not stdout.lstrip().startswith(("{", "[")):
+        return {"raw": stdout}
+    try:
+        return json.loads(stdout)
+    except ValueError:
+        return {"raw": stdout}
+
+
+def _finish_optional_plugin_json(
+    *,
+    plugin: str,
+    proc: subprocess.CompletedProcess[str],
+    wg_dir: Path,
+    task_id: str,
+    mode: str,
+    force_create_followups: bool,
+) -> dict[str, Any]:
+    """Parse a finished optional plugin process and create followups from its findings."""
+    _write_log, create_followups = _mode_flags(mode=mode, plugin=plugin)
+    create_followups = create_followups or force_create_followups
     rc = int(proc.returncode)
     if rc in (ExitCode.ok, ExitCode.findings):
         if _plugin_supports_json(plugin):
-            try:
-                report: Any = json.loads(proc.stdout or "{}")
-            except Exception:
-                report = {"raw": proc.stdout}
+            report: Any = _parse_plugin_stdout(proc.stdout)
             # Validate against lane plugin contract
             from driftdriver.lane_contract import validate_lane_output
 
@@ -447,12 +552,12 @@ def _run_optional_plugin_json(
     err_report = {
         "error": f"{plugin} failed",
         "exit_code": rc,
-        "stderr": (proc.stderr or "")[:4000],
+        "stderr": (proc.stderr or "")[:_PLUGIN_STDERR_LIMIT],
     }
     return {"ran": True, "exit_code": 0, "report": err_report}
 
 
-def _run_optional_plugin_text(
+def _run_optional_plugin_json(
     *,
     plugin: str,
     enabled: bool,
@@ -462,30 +567,192 @@ def _run_optional_plugin_text(
     mode: str,
     force_write_log: bool,
     force_create_followups: bool,
-) -> int:
-    plugin_bin = wg_dir / plugin
-    if not plugin_bin.exists():
+) -> dict[str, Any]:
+    cmd = _optional_plugin_cmd(
+        plugin=plugin,
+        enabled=enabled,
+        wg_dir=wg_dir,
+        project_dir=project_dir,
+        task_id=task_id,
+        mode=mode,
+        force_write_log=force_write_log,
+        want_json=True,
+    )
+    if cmd is None:
+        return {"ran": False, "exit_code": 0, "report": None}
+    proc = subprocess.run(cmd, text=True, capture_output=True)
+    return _finish_optional_plugin_json(
+        plugin=plugin,
+        proc=proc,
+        wg_dir=wg_dir,
+        task_id=task_id,
+        mode=mode,
+        force_create_followups=force_create_followups,
+    )
+
+
+async def _read_capped(stream: asyncio.StreamReader, limit: int | None) -> bytes:
+    """Drain ``stream`` fully but keep at most its first ``limit`` bytes."""
+    if limit is None:
+        return await stream.read()
+    buf = bytearray()
+    while chunk := await stream.read(65536):
+        if len(buf) < limit:
+            buf += chunk[: limit - len(buf)]
+    return bytes(buf)
+
+
+async def _run_subprocess(cmd: list[str], *, stderr_limit: int | None = None) -> subprocess.CompletedProcess[str]:
+    import asyncio
+
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    out, err = await asyncio.gather(
+        proc.stdout.read(),  # type: ignore[union-attr]
+        _read_capped(proc.stderr, stderr_limit),  # type: ignore[arg-type]
+    )
+    await proc.wait()
+    return subprocess.CompletedProcess(
+        cmd,
+        int(proc.returncode or 0),
+        out.decode("utf-8", errors="replace"),
+        err.decode("utf-8", errors="replace"),
+    )
+
+
+async def _run_subprocesses(
+    cmds: dict[str, list[str]],
+    *,
+    stderr_limits: dict[str, int] | None = None,
+) -> dict[str, subprocess.CompletedProcess[str]]:
+    """Run independent commands concurrently on one event loop, keyed like ``cmds``.
+
+    ``stderr_limits`` caps how much of a command's stderr is retained; the rest is
+    drained and dropped so a chatty plugin cannot balloon memory.
+    """
+    import asyncio
+
+    limits = stderr_limits or {}
+    results = await asyncio.gather(
+        *(_run_subprocess(cmd, stderr_limit=limits.get(name)) for name, cmd in cmds.items())
+    )
+    return dict(zip(cmds, results))
+
+
+async def _run_subprocesses_gated(
+    cmds: dict[str, list[str]],
+    *,
+    gate: str,
+    deferred: frozenset[str],
+    ok_codes: tuple[int, ...],
+    stderr_limits: dict[str, int] | None = None,
+) -> dict[str, subprocess.CompletedProcess[str]]:
+    """Like :func:`_run_subprocesses`, but ``deferred`` commands only start once
+    ``gate`` has exited with one of ``ok_codes``; otherwise they never run.
+    Everything else runs alongside ``gate`` from the start.
+    """
+    import asyncio
+
+    limits = stderr_limits or {}
+
+    async def _gate_then_deferred() -> dict[str, subprocess.CompletedProcess[str]]:
+        gate_proc = await _run_subprocess(cmds[gate], stderr_limit=limits.get(gate))
+        if gate_proc.returncode not in ok_codes:
+            return {gate: gate_proc}
+        rest = await _run_subprocesses({n: c for n, c in cmds.items() if n in deferred}, stderr_limits=limits)
+        return {gate: gate_proc, **rest}
+
+    free = {n: c for n, c in cmds.items() if n != gate and n not in deferred}
+    gated, free_results = await asyncio.gather(
+        _gate_then_deferred(), _run_subprocesses(free, stderr_limits=limits)
+    )
+    return {**free_results, **gated}
+
+
+def _run_subprocesses_blocking(
+    cmds: dict[str, list[str]],
+    *,
+    stderr_limits: dict[str, int] | None = None,
+) -> dict[str, subprocess.CompletedProcess[str]]:
+    # asyncio costs ~35ms to import; only pay it when plugins actually run.
+    import asyncio
+
+    return asyncio.run(_run_subprocesses(cmds, stderr_limits=stderr_limits))
+
+
+def _run_subprocesses_gated_blocking(
+    cmds: dict[str, list[str]],
+    *,
+    gate: str,
+    deferred: frozenset[str],
+    ok_codes: tuple[int, ...],
+    stderr_limits: dict[str, int] | None = None,
+) -> dict[str, subprocess.CompletedProcess[str]]:
+    import asyncio
+
+    return asyncio.run(
+        _run_subprocesses_gated(
+            cmds, gate=gate, deferred=deferred, ok_codes=ok_codes, stderr_limits=stderr_limits
+        )
+    )
+
+
+def _plugin_text_rc(*, plugin: str, rc: int) -> int:
+    if rc in (ExitCode.ok, ExitCode.findings):
+        return rc
+    print(f"note: {plugin} failed (exit {rc}); continuing", file=sys.stderr)
+    return 0
+
+
+def _run_plugin_text_cmd(*, plugin: str, cmd: list[str] | None) -> int:
+    if cmd is None:
         return 0
-    if not enabled:
+    return _plugin_text_rc(plugin=plugin, rc=int(_run(cmd)))
+
+
+def _replay_plugin_text(*, plugin: str, proc: subprocess.CompletedProcess[str] | None) -> int:
+    """Write a captured plugin run's output to our stdout/stderr and map its exit code."""
+    if proc is None:
         return 0
+    # Flush stdout before writing stderr so a shared 2>&1 pipe keeps the order.
+    if proc.stdout:
+        sys.stdout.write(proc.stdout)
+        sys.stdout.flush()
+    if proc.stderr:
+        sys.stderr.write(proc.stderr)
+        sys.stderr.flush()
+    return _plugin_text_rc(plugin=plugin, rc=int(proc.returncode))
 
-    write_log, _create_followups = _mode_flags(mode=mode, plugin=plugin)
-    write_log = write_log or force_write_log
+
+def _run_optional_plugin_text(
+    *,
+    plugin: str,
+    enabled: bool,
+    wg_dir: Path,
+    project_dir: Path,
+    task_id: str,
+    mode: str,
+    force_write_log: bool,
+    force_create_followups: bool,
+) -> int:
+    # Compat shim: cmd_check builds its plugin plan once and no longer calls
+    # this; kept for callers importing it from driftdriver.cli.
     # Text mode: followups are not created (no structured output to parse).
     # Only JSON mode routes findings through guarded_add_drift_task.
-    cmd = _plugin_cmd(
+    cmd = _optional_plugin_cmd(
         plugin=plugin,
-        plugin_bin=plugin_bin,
+        enabled=enabled,
+        wg_dir=wg_dir,
         project_dir=project_dir,
         task_id=task_id,
+        mode=mode,
+        force_write_log=force_write_log,
         want_json=False,
-        write_log=write_log,
     )
-    rc = int(_run(cmd))
-    if rc in (ExitCode.ok, ExitCode.findings):
-        return rc
-    print(f"note: {plugin} failed (exit {rc}); continuing", file=sys.stderr)
-    return 0
+    return _run_plugin_text_cmd(plugin=plugin, cmd=cmd)
 
 
 def _run_internal_lane(
@@ -583,25 +850,26 @@ def _count_contract_compliance(plugins_json: dict) -> dict[str, Any]:
     }
 
 
+# (write_log, create_followups) per policy mode; unknown modes behave like redirect.
+_MODE_FLAGS: dict[str, tuple[bool, bool]] = {
+    "observe": (False, False),
+    "advise": (True, False),
+    "redirect": (True, True),
+    "heal": (True, False),
+    "breaker": (True, False),
+}
+_MODE_PLUGIN_FLAGS: dict[tuple[str, str], tuple[bool, bool]] = {
+    ("heal", "therapydrift"): (True, True),
+}
+
+
 def _mode_flags(*, mode: str, plugin: str) -> tuple[bool, bool]:
     """
     Returns (write_log, create_followups) for a plugin under the policy mode.
     """
 
     m = str(mode or "redirect").strip().lower()
-    if m == "observe":
-        return (False, False)
-    if m == "advise":
-        return (True, False)
-    if m == "redirect":
-        return (True, True)
-    if m == "heal":
-        if plugin == "therapydrift":
-            return (True, True)
-        return (True, False)
-    if m == "breaker":
-        return (True, False)
-    return (True, True)
+    return _MODE_PLUGIN_FLAGS.get((m, plugin)) or _MODE_FLAGS.get(m, (True, True))
 
 
 def _ensure_breaker_task(*, wg_dir: Path, task_id: str, actor: Any = None) -> str:
@@ -849,10 +1117,10 @@ def cmd_check(args: argparse.Namespace) -> int:
     if gate_mode:
         args.json = True
 
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
+    wg_dir = _find_wg_dir(args.dir)
     project_dir = wg_dir.parent
     task_id = str(args.task)
-    policy = load_drift_policy(wg_dir)
+    policy = _load_policy_cached(wg_dir)
     # Repeat-ignoring escalation: surface findings flagged+ignored repeatedly as
     # follow-up tasks so they inform the next graph work instead of accumulating
     # silently in the outcome ledger. Advisory only; never blocks the check.
@@ -873,8 +1141,10 @@ def cmd_check(args: argparse.Namespace) -> int:
             "error": str(exc),
         }
 
+    # One directory scan answers every "is this wrapper installed?" question below.
+    present = _present_wrappers(wg_dir)
     coredrift = wg_dir / "coredrift"
-    if not coredrift.exists():
+    if "coredrift" not in present:
         print("error: .workgraph/coredrift not found; run driftdriver install first", file=sys.stderr)
         return ExitCode.usage
 
@@ -929,20 +1199,47 @@ def cmd_check(args: argparse.Namespace) -> int:
     speed_cmd = [str(coredrift), "--dir", str(project_dir), "check", "--task", task_id]
     if speed_write_log:
         speed_cmd.append("--write-log")
+    # One plugin plan shared by the JSON and text paths; None means "skip".
+    plugin_cmds: dict[str, list[str] | None] = {
+        plugin: _optional_plugin_cmd(
+            plugin=plugin,
+            enabled=(plugin in selected_plugins),
+            wg_dir=wg_dir,
+            project_dir=project_dir,
+            task_id=task_id,
+            mode=effective_mode,
+            force_write_log=force_write_log,
+            want_json=bool(args.json),
+            present=present,
+        )
+        for plugin in ordered_plugins
+    }
     # NOTE: --create-followups is NOT passed to coredrift subprocess.
     # Followups are created by driftdriver from parsed JSON output.
     if args.json:
         # JSON mode: capture sub-tool outputs and emit a single combined JSON object.
         speed_cmd.append("--json")
-        speed_proc = subprocess.run(speed_cmd, text=True, capture_output=True)
+        # Read-only plugins launch alongside coredrift. Plugins that --write-log
+        # wait for coredrift to exit 0/3, so a coredrift error (which returns
+        # early below) never leaves their log side effects behind; read-only
+        # plugin output is simply discarded in that case. Parsing and followup
+        # creation stay sequential.
+        launch_cmds = {"coredrift": speed_cmd}
+        launch_cmds.update((plugin, cmd) for plugin, cmd in plugin_cmds.items() if cmd is not None)
+        # coredrift's stderr is echoed in full on failure; plugins only keep an excerpt.
+        procs = _run_subprocesses_gated_blocking(
+            launch_cmds,
+            gate="coredrift",
+            deferred=frozenset(p for p, cmd in launch_cmds.items() if p != "coredrift" and "--write-log" in cmd),
+            ok_codes=(ExitCode.ok, ExitCode.findings),
+            stderr_limits={plugin: _PLUGIN_STDERR_LIMIT for plugin in launch_cmds if plugin != "coredrift"},
+        )
+        speed_proc = procs.pop("coredrift")
         speed_rc = int(speed_proc.returncode)
         if speed_rc not in (0, ExitCode.findings):
             sys.stderr.write(speed_proc.stderr or "")
             return speed_rc
-        try:
-            speed_report = json.loads(speed_proc.stdout or "{}")
-        except Exception:
-            speed_report = {"raw": speed_proc.stdout}
+        speed_report = _parse_plugin_stdout(speed_proc.stdout)
 
         # Create followup tasks from coredrift findings through the directive interface.
         if speed_followups:
@@ -960,16 +1257,18 @@ def cmd_check(args: argparse.Namespace) -> int:
         plugin_results: dict[str, dict[str, Any]] = {}
         rc_by_plugin: dict[str, int] = {"coredrift": speed_rc}
         for plugin in ordered_plugins:
-            result = _run_optional_plugin_json(
-                plugin=plugin,
-                enabled=(plugin in selected_plugins),
-                wg_dir=wg_dir,
-                project_dir=project_dir,
-                task_id=task_id,
-                mode=effective_mode,
-                force_write_log=force_write_log,
-                force_create_followups=effective_force_create_followups,
-            )
+            proc = procs.get(plugin)
+            if proc is None:
+                result = {"ran": False, "exit_code": 0, "report": None}
+            else:
+                result = _finish_optional_plugin_json(
+                    plugin=plugin,
+                    proc=proc,
+                    wg_dir=wg_dir,
+                    task_id=task_id,
+                    mode=effective_mode,
+                    force_create_followups=effective_force_create_followups,
+                )
             plugin_results[plugin] = result
             rc_by_plugin[plugin] = int(result.get("exit_code", 0))
 
@@ -990,28 +1289,11 @@ def cmd_check(args: argparse.Namespace) -> int:
             "coredrift": {"ran": True, "exit_code": speed_rc, "report": speed_report},
         }
         for plugin in OPTIONAL_PLUGINS:
-            result = plugin_results.get(plugin, {"ran": False, "exit_code": 0, "report": None})
-            if plugin == "uxdrift":
-                plugins_json[plugin] = {
-                    "ran": bool(result.get("ran")),
-                    "exit_code": int(result.get("exit_code", 0)),
-                    "note": "no standardized json output yet",
-                }
-            else:
-                plugins_json[plugin] = {
-                    "ran": bool(result.get("ran")),
-                    "exit_code": int(result.get("exit_code", 0)),
-                    "report": result.get("report"),
-                }
+            plugins_json[plugin] = _project_plugin_result(plugin, plugin_results.get(plugin))
 
         # Add internal lane results into combined plugins dict.
         for lane in INTERNAL_LANES:
-            il_result = internal_results.get(lane, {"ran": False, "exit_code": 0, "report": None})
-            plugins_json[lane] = {
-                "ran": bool(il_result.get("ran")),
-                "exit_code": int(il_result.get("exit_code", 0)),
-                "report": il_result.get("report"),
-            }
+            plugins_json[lane] = _project_plugin_result(lane, internal_results.get(lane))
 
         # Enforcement quality gates — evaluate severity-based thresholds.
         enforcement_findings = collect_enforcement_findings(plugins_json)
@@ -1103,7 +1385,11 @@ def cmd_check(args: argparse.Namespace) -> int:
                 verdict = "FAIL" if _g_blocks else "pass"
                 print(f"gate: {verdict} — {_g_n} blocking finding(s)")
         else:
-            print(json.dumps(combined, indent=2, sort_keys=False))
+            # Pretty-print for humans; pipes (jq, _invoke_check_json) get compact JSON.
+            if sys.stdout.isatty():
+                print(json.dumps(combined, indent=2))
+            else:
+                print(json.dumps(combined, separators=(",", ":")))
         return final_rc
 
     if repo_auto_update.get("refreshed"):
@@ -1120,17 +1406,19 @@ def cmd_check(args: argparse.Namespace) -> int:
         print(f"note: lane preflight selected full suite ({reason_text})", file=sys.stderr)
 
     rc_by_plugin: dict[str, int] = {"coredrift": speed_rc}
-    for plugin in ordered_plugins:
-        rc_by_plugin[plugin] = _run_optional_plugin_text(
-            plugin=plugin,
-            enabled=(plugin in selected_plugins),
-            wg_dir=wg_dir,
-            project_dir=project_dir,
-            task_id=task_id,
-            mode=effective_mode,
-            force_write_log=force_write_log,
-            force_create_followups=effective_force_create_followups,
-        )
+    if sys.stdout.isatty():
+        # Interactive: stream each plugin straight to the terminal, in order, so
+        # colour/progress detection and live output keep working.
+        for plugin, cmd in plugin_cmds.items():
+            rc_by_plugin[plugin] = _run_plugin_text_cmd(plugin=plugin, cmd=cmd)
+    else:
+        # Piped/captured: run plugins concurrently, then replay each one's
+        # captured output in policy order so plugins never interleave. Within
+        # a plugin, its stdout is replayed before its stderr.
+        runnable = {plugin: cmd for plugin, cmd in plugin_cmds.items() if cmd is not None}
+        text_procs = _run_subprocesses_blocking(runnable) if runnable else {}
+        for plugin in plugin_cmds:
+            rc_by_plugin[plugin] = _replay_plugin_text(plugin=plugin, proc=text_procs.get(plugin))
 
     # Run internal lanes (text path — print summary lines).
     # Collect structured results for enforcement evaluation.
@@ -1234,8 +1522,8 @@ def cmd_check(args: argparse.Namespace) -> int:
 
 
 def cmd_updates(args: argparse.Namespace) -> int:
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
-    policy = load_drift_policy(wg_dir)
+    wg_dir = _find_wg_dir(args.dir)
+    policy = _load_policy_cached(wg_dir)
     enabled = bool(policy.updates_enabled)
     force = bool(getattr(args, "force", False))
 
@@ -7,7 +7,7 @@ import sys
 import time
 from pathlib import Path
 
-from driftdriver.workgraph import find_workgraph_dir
+from ._helpers import _find_wg_dir
 
 
 def cmd_debate_start(args: argparse.Namespace) -> int:
@@ -16,7 +16,7 @@ def cmd_debate_start(args: argparse.Namespace) -> int:
         print("error: --task is required", file=sys.stderr)
         return 2
 
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
+    wg_dir = _find_wg_dir(args.dir)
     project_dir = wg_dir.parent
 
     from driftdriver.workgraph import load_workgraph
@@ -128,7 +128,7 @@ def cmd_debate_status(args: argparse.Namespace) -> int:
         print("error: --task is required", file=sys.stderr)
         return 2
 
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
+    wg_dir = _find_wg_dir(args.dir)
     debate_dir = wg_dir / ".debatedrift" / task_id
 
     if not debate_dir.exists():
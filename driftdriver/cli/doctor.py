@@ -24,10 +24,10 @@ from driftdriver.health import (
     redrift_depth,
 )
 from driftdriver.policy import load_drift_policy
-from driftdriver.workgraph import find_workgraph_dir, load_workgraph
+from driftdriver.workgraph import load_workgraph
 
 from .check import ExitCode
-from ._helpers import _maybe_auto_ensure_contracts, _wrapper_commands_available
+from ._helpers import _find_wg_dir, _maybe_auto_ensure_contracts, _wrapper_commands_available
 from .install_cmd import cmd_install
 
 
@@ -229,7 +229,7 @@ def _repair_wrappers(*, wg_dir: Path) -> int:
 
 
 def cmd_queue(args: argparse.Namespace) -> int:
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
+    wg_dir = _find_wg_dir(args.dir)
     wg = load_workgraph(wg_dir)
     tasks = list(wg.tasks.values())
 
@@ -261,7 +261,7 @@ def cmd_queue(args: argparse.Namespace) -> int:
 
 
 def cmd_compact(args: argparse.Namespace) -> int:
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
+    wg_dir = _find_wg_dir(args.dir)
     policy = load_drift_policy(wg_dir)
     wg = load_workgraph(wg_dir)
     tasks = list(wg.tasks.values())
@@ -358,7 +358,7 @@ def cmd_compact(args: argparse.Namespace) -> int:
 
 
 def cmd_doctor(args: argparse.Namespace) -> int:
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
+    wg_dir = _find_wg_dir(args.dir)
     project_dir = wg_dir.parent
     policy = load_drift_policy(wg_dir)
     notes: list[str] = []
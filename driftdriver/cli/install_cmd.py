@@ -4,65 +4,81 @@
 from __future__ import annotations
 
 import argparse
-import shutil
+import json
 import subprocess
 import sys
-from dataclasses import asdict
+from functools import partial
 from pathlib import Path
-from typing import Any
-
-from driftdriver.install import (
-    InstallResult,
-    ensure_amplifier_autostart_hook,
-    ensure_amplifier_executor,
-    install_amplifier_adapter,
-    install_claude_adapter,
-    install_claude_code_hooks,
-    install_codex_adapter,
-    install_handler_scripts,
-    install_hook_scripts,
-    install_lessons_mcp_config,
-    install_opencode_hooks,
-    refresh_existing_managed_surfaces,
-    install_session_driver_executor,
-    ensure_archdrift_gitignore,
-    ensure_executor_guidance,
-    ensure_datadrift_gitignore,
-    ensure_depsdrift_gitignore,
-    ensure_fixdrift_gitignore,
-    ensure_debatedrift_gitignore,
-    ensure_qadrift_gitignore,
-    ensure_redrift_gitignore,
-    ensure_specdrift_gitignore,
-    ensure_coredrift_gitignore,
-    ensure_therapydrift_gitignore,
-    ensure_uxdrift_gitignore,
-    ensure_yagnidrift_gitignore,
-    resolve_bin,
-    write_archdrift_wrapper,
-    write_debatedrift_wrapper,
-    write_modelrift_wrapper,
-    write_qadrift_wrapper,
-    write_surfacedrift_wrapper,
-    write_datadrift_wrapper,
-    write_depsdrift_wrapper,
-    write_drifts_wrapper,
-    write_driver_wrapper,
-    write_fixdrift_wrapper,
-    write_redrift_wrapper,
-    write_specdrift_wrapper,
-    write_coredrift_wrapper,
-    write_therapydrift_wrapper,
-    write_uxdrift_wrapper,
-    write_yagnidrift_wrapper,
-)
+from typing import Any, Callable
+
 from driftdriver.policy import ensure_drift_policy
-from driftdriver.workgraph import find_workgraph_dir
 
 from .check import ExitCode, _ensure_wg_init
+from ._helpers import _find_wg_dir
+
+
+# Sibling tools resolved via --<tool>-bin, $<TOOL>_BIN, PATH, then ../<tool>/bin/<tool>.
+_PLUGIN_BIN_TOOLS = (
+    "coredrift",
+    "specdrift",
+    "uxdrift",
+    "therapydrift",
+    "fixdrift",
+    "yagnidrift",
+    "redrift",
+    "datadrift",
+    "archdrift",
+    "depsdrift",
+)
+
+# Opt-in tools only worth probing when --with-<tool> or --<tool>-bin asks for them.
+_OPT_IN_BIN_TOOLS = frozenset({"uxdrift", "therapydrift", "fixdrift", "yagnidrift", "redrift"})
+
+
+def _sibling_bin(repo_parent: str, name: str) -> Path:
+    """Candidate ``<repo_parent>/<name>/bin/<name>`` built as one string join."""
+    return Path(f"{repo_parent}/{name}/bin/{name}")
 
 
 def cmd_install(args: argparse.Namespace) -> int:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from driftdriver.install import (
+        InstallResult,
+        ensure_amplifier_autostart_hook,
+        ensure_amplifier_executor,
+        install_amplifier_adapter,
+        install_claude_adapter,
+        install_claude_code_hooks,
+        install_codex_adapter,
+        install_handler_scripts,
+        install_hook_scripts,
+        install_lessons_mcp_config,
+        install_opencode_hooks,
+        refresh_existing_managed_surfaces,
+        install_session_driver_executor,
+        ensure_executor_guidance,
+        ensure_gitignore_entries,
+        resolve_bin,
+        which_cached,
+        write_archdrift_wrapper,
+        write_debatedrift_wrapper,
+        write_modelrift_wrapper,
+        write_qadrift_wrapper,
+        write_surfacedrift_wrapper,
+        write_datadrift_wrapper,
+        write_depsdrift_wrapper,
+        write_drifts_wrapper,
+        write_driver_wrapper,
+        write_fixdrift_wrapper,
+        write_redrift_wrapper,
+        write_specdrift_wrapper,
+        write_coredrift_wrapper,
+        write_therapydrift_wrapper,
+        write_uxdrift_wrapper,
+        write_yagnidrift_wrapper,
+    )
+
     project_dir = Path.cwd()
     if args.dir:
         project_dir = Path(args.dir)
@@ -71,203 +87,166 @@ def cmd_install(args: argparse.Namespace) -> int:
 
     _ensure_wg_init(project_dir)
 
-    wg_dir = find_workgraph_dir(project_dir)
+    wg_dir = _find_wg_dir(project_dir)
 
     wrapper_mode = str(getattr(args, "wrapper_mode", "auto") or "auto").strip().lower()
     if wrapper_mode not in ("auto", "pinned", "portable"):
         print("error: --wrapper-mode must be one of: auto, pinned, portable", file=sys.stderr)
         return ExitCode.usage
 
-    # Resolve tool bins.
+    # Resolve tool bins. Each lookup is an independent set of env/PATH/filesystem
+    # probes, so fan them out across a small thread pool.
     repo_root = Path(__file__).resolve().parents[2]
-    driver_bin = resolve_bin(
-        explicit=None,
-        env_var="DRIFTDRIVER_BIN",
-        which_name="driftdriver",
-        candidates=[repo_root / "bin" / "driftdriver"],
-    )
+    repo_parent = str(repo_root.parent)
+    bin_specs: dict[str, dict[str, Any]] = {
+        "driftdriver": {
+            "explicit": None,
+            "env_var": "DRIFTDRIVER_BIN",
+            "which_name": "driftdriver",
+            "candidates": [Path(f"{repo_root}/bin/driftdriver")],
+        },
+    }
+    for tool in _PLUGIN_BIN_TOOLS:
+        explicit = getattr(args, f"{tool}_bin", None)
+        if tool in _OPT_IN_BIN_TOOLS and not (explicit or getattr(args, f"with_{tool}", False)):
+            continue
+        bin_specs[tool] = {
+            "explicit": Path(explicit) if explicit else None,
+            "env_var": f"{tool.upper()}_BIN",
+            "which_name": tool,
+            "candidates": [_sibling_bin(repo_parent, tool)],
+        }
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        resolved = dict(zip(bin_specs, pool.map(lambda kw: resolve_bin(**kw), bin_specs.values())))
+
+    driver_bin = resolved["driftdriver"]
     if driver_bin is None:
         print("error: could not find driftdriver; set $DRIFTDRIVER_BIN", file=sys.stderr)
         return ExitCode.usage
 
-    coredrift_bin = resolve_bin(
-        explicit=Path(args.coredrift_bin) if args.coredrift_bin else None,
-        env_var="COREDRIFT_BIN",
-        which_name="coredrift",
-        candidates=[
-            repo_root.parent / "coredrift" / "bin" / "coredrift",
-        ],
-    )
+    coredrift_bin = resolved["coredrift"]
     if coredrift_bin is None:
         print("error: could not find coredrift; pass --coredrift-bin or set $COREDRIFT_BIN", file=sys.stderr)
         return ExitCode.usage
 
-    specdrift_bin = resolve_bin(
-        explicit=Path(args.specdrift_bin) if args.specdrift_bin else None,
-        env_var="SPECDRIFT_BIN",
-        which_name="specdrift",
-        candidates=[
-            repo_root.parent / "specdrift" / "bin" / "specdrift",
-        ],
-    )
+    specdrift_bin = resolved["specdrift"]
 
     include_uxdrift = bool(args.with_uxdrift or args.uxdrift_bin)
-    uxdrift_bin = resolve_bin(
-        explicit=Path(args.uxdrift_bin) if args.uxdrift_bin else None,
-        env_var="UXDRIFT_BIN",
-        which_name="uxdrift",
-        candidates=[
-            repo_root.parent / "uxdrift" / "bin" / "uxdrift",
-        ],
-    )
+    uxdrift_bin = resolved.get("uxdrift")
     if include_uxdrift and uxdrift_bin is None:
         # Best-effort: don't fail install.
         include_uxdrift = False
 
     include_therapydrift = bool(args.with_therapydrift or args.therapydrift_bin)
-    therapydrift_bin = resolve_bin(
-        explicit=Path(args.therapydrift_bin) if args.therapydrift_bin else None,
-        env_var="THERAPYDRIFT_BIN",
-        which_name="therapydrift",
-        candidates=[
-            repo_root.parent / "therapydrift" / "bin" / "therapydrift",
-        ],
-    )
+    therapydrift_bin = resolved.get("therapydrift")
     if include_therapydrift and therapydrift_bin is None:
         # Best-effort: don't fail install.
         include_therapydrift = False
 
     include_fixdrift = bool(args.with_fixdrift or args.fixdrift_bin)
-    fixdrift_bin = resolve_bin(
-        explicit=Path(args.fixdrift_bin) if args.fixdrift_bin else None,
-        env_var="FIXDRIFT_BIN",
-        which_name="fixdrift",
-        candidates=[
-            repo_root.parent / "fixdrift" / "bin" / "fixdrift",
-        ],
-    )
+    fixdrift_bin = resolved.get("fixdrift")
     if include_fixdrift and fixdrift_bin is None:
         # Best-effort: don't fail install.
         include_fixdrift = False
 
     include_yagnidrift = bool(args.with_yagnidrift or args.yagnidrift_bin)
-    yagnidrift_bin = resolve_bin(
-        explicit=Path(args.yagnidrift_bin) if args.yagnidrift_bin else None,
-        env_var="YAGNIDRIFT_BIN",
-        which_name="yagnidrift",
-        candidates=[
-            repo_root.parent / "yagnidrift" / "bin" / "yagnidrift",
-        ],
-    )
+    yagnidrift_bin = resolved.get("yagnidrift")
     if include_yagnidrift and yagnidrift_bin is None:
         # Best-effort: don't fail install.
         include_yagnidrift = False
 
     include_redrift = bool(args.with_redrift or args.redrift_bin)
-    redrift_bin = resolve_bin(
-        explicit=Path(args.redrift_bin) if args.redrift_bin else None,
-        env_var="REDRIFT_BIN",
-        which_name="redrift",
-        candidates=[
-            repo_root.parent / "redrift" / "bin" / "redrift",
-        ],
-    )
+    redrift_bin = resolved.get("redrift")
     if include_redrift and redrift_bin is None:
         # Best-effort: don't fail install.
         include_redrift = False
 
-    datadrift_bin = resolve_bin(
-        explicit=Path(args.datadrift_bin) if args.datadrift_bin else None,
-        env_var="DATADRIFT_BIN",
-        which_name="datadrift",
-        candidates=[
-            repo_root.parent / "datadrift" / "bin" / "datadrift",
-        ],
-    )
-
-    archdrift_bin = resolve_bin(
-        explicit=Path(args.archdrift_bin) if args.archdrift_bin else None,
-        env_var="ARCHDRIFT_BIN",
-        which_name="archdrift",
-        candidates=[
-            repo_root.parent / "archdrift" / "bin" / "archdrift",
-        ],
-    )
-
-    depsdrift_bin = resolve_bin(
-        explicit=Path(args.depsdrift_bin) if args.depsdrift_bin else None,
-        env_var="DEPSDRIFT_BIN",
-        which_name="depsdrift",
-        candidates=[
-            repo_root.parent / "depsdrift" / "bin" / "depsdrift",
-        ],
-    )
+    datadrift_bin = resolved["datadrift"]
+    archdrift_bin = resolved["archdrift"]
+    depsdrift_bin = resolved["depsdrift"]
 
+    driver_on_path = bool(which_cached("driftdriver"))
+    coredrift_on_path = bool(which_cached("coredrift"))
     if wrapper_mode == "auto":
         # Choose portable only when the core tools are installed on PATH.
-        wrapper_mode = "portable" if (shutil.which("driftdriver") and shutil.which("coredrift")) else "pinned"
+        wrapper_mode = "portable" if (driver_on_path and coredrift_on_path) else "pinned"
 
     if wrapper_mode == "portable":
-        if not shutil.which("driftdriver"):
+        if not driver_on_path:
             print("error: --wrapper-mode portable requires driftdriver on PATH", file=sys.stderr)
             return ExitCode.usage
-        if not shutil.which("coredrift"):
+        if not coredrift_on_path:
             print("error: --wrapper-mode portable requires coredrift on PATH", file=sys.stderr)
             return ExitCode.usage
 
     handler_written, handler_count = install_handler_scripts(wg_dir)
     hook_written, hook_count = install_hook_scripts(wg_dir)
 
-    wrote_driver = write_driver_wrapper(wg_dir, driver_bin=driver_bin, wrapper_mode=wrapper_mode)
-    wrote_drifts = write_drifts_wrapper(wg_dir)
-    wrote_coredrift = write_coredrift_wrapper(wg_dir, coredrift_bin=coredrift_bin, wrapper_mode=wrapper_mode)
-    wrote_specdrift = False
+    # Each wrapper is its own file under .workgraph/, so write them concurrently.
+    wrapper_jobs: dict[str, Callable[[], bool]] = {
+        "driftdriver": partial(write_driver_wrapper, wg_dir, driver_bin=driver_bin, wrapper_mode=wrapper_mode),
+        "drifts": partial(write_drifts_wrapper, wg_dir),
+        "coredrift": partial(write_coredrift_wrapper, wg_dir, coredrift_bin=coredrift_bin, wrapper_mode=wrapper_mode),
+        "qadrift": partial(write_qadrift_wrapper, wg_dir),
+        "debatedrift": partial(write_debatedrift_wrapper, wg_dir),
+        "modelrift": partial(write_modelrift_wrapper, wg_dir),
+        "surfacedrift": partial(write_surfacedrift_wrapper, wg_dir),
+    }
     if specdrift_bin is not None:
-        wrote_specdrift = write_specdrift_wrapper(wg_dir, specdrift_bin=specdrift_bin, wrapper_mode=wrapper_mode)
-    wrote_datadrift = False
+        wrapper_jobs["specdrift"] = partial(
+            write_specdrift_wrapper, wg_dir, specdrift_bin=specdrift_bin, wrapper_mode=wrapper_mode
+        )
     if datadrift_bin is not None:
-        wrote_datadrift = write_datadrift_wrapper(wg_dir, datadrift_bin=datadrift_bin, wrapper_mode=wrapper_mode)
-    wrote_archdrift = False
+        wrapper_jobs["datadrift"] = partial(
+            write_datadrift_wrapper, wg_dir, datadrift_bin=datadrift_bin, wrapper_mode=wrapper_mode
+        )
     if archdrift_bin is not None:
-        wrote_archdrift = write_archdrift_wrapper(wg_dir, archdrift_bin=archdrift_bin, wrapper_mode=wrapper_mode)
-    wrote_depsdrift = False
+        wrapper_jobs["archdrift"] = partial(
+            write_archdrift_wrapper, wg_dir, archdrift_bin=archdrift_bin, wrapper_mode=wrapper_mode
+        )
     if depsdrift_bin is not None:
-        wrote_depsdrift = write_depsdrift_wrapper(wg_dir, depsdrift_bin=depsdrift_bin, wrapper_mode=wrapper_mode)
-    wrote_uxdrift = False
+        wrapper_jobs["depsdrift"] = partial(
+            write_depsdrift_wrapper, wg_dir, depsdrift_bin=depsdrift_bin, wrapper_mode=wrapper_mode
+        )
     if include_uxdrift and uxdrift_bin is not None:
-        wrote_uxdrift = write_uxdrift_wrapper(wg_dir, uxdrift_bin=uxdrift_bin, wrapper_mode=wrapper_mode)
-    wrote_therapydrift = False
+        wrapper_jobs["uxdrift"] = partial(
+            write_uxdrift_wrapper, wg_dir, uxdrift_bin=uxdrift_bin, wrapper_mode=wrapper_mode
+        )
     if include_therapydrift and therapydrift_bin is not None:
-        wrote_therapydrift = write_therapydrift_wrapper(
-            wg_dir,
-            therapydrift_bin=therapydrift_bin,
-            wrapper_mode=wrapper_mode,
+        wrapper_jobs["therapydrift"] = partial(
+            write_therapydrift_wrapper, wg_dir, therapydrift_bin=therapydrift_bin, wrapper_mode=wrapper_mode
         )
-    wrote_fixdrift = False
     if include_fixdrift and fixdrift_bin is not None:
-        wrote_fixdrift = write_fixdrift_wrapper(
-            wg_dir,
-            fixdrift_bin=fixdrift_bin,
-            wrapper_mode=wrapper_mode,
+        wrapper_jobs["fixdrift"] = partial(
+            write_fixdrift_wrapper, wg_dir, fixdrift_bin=fixdrift_bin, wrapper_mode=wrapper_mode
         )
-    wrote_yagnidrift = False
     if include_yagnidrift and yagnidrift_bin is not None:
-        wrote_yagnidrift = write_yagnidrift_wrapper(
-            wg_dir,
-            yagnidrift_bin=yagnidrift_bin,
-            wrapper_mode=wrapper_mode,
+        wrapper_jobs["yagnidrift"] = partial(
+            write_yagnidrift_wrapper, wg_dir, yagnidrift_bin=yagnidrift_bin, wrapper_mode=wrapper_mode
         )
-    wrote_redrift = False
     if include_redrift and redrift_bin is not None:
-        wrote_redrift = write_redrift_wrapper(
-            wg_dir,
-            redrift_bin=redrift_bin,
-            wrapper_mode=wrapper_mode,
+        wrapper_jobs["redrift"] = partial(
+            write_redrift_wrapper, wg_dir, redrift_bin=redrift_bin, wrapper_mode=wrapper_mode
         )
-    wrote_qadrift = write_qadrift_wrapper(wg_dir)
-    wrote_debatedrift = write_debatedrift_wrapper(wg_dir)
-    wrote_modelrift = write_modelrift_wrapper(wg_dir)
-    wrote_surfacedrift = write_surfacedrift_wrapper(wg_dir)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        wrote = dict(zip(wrapper_jobs, pool.map(lambda job: job(), wrapper_jobs.values())))
+
+    wrote_driver = wrote["driftdriver"]
+    wrote_drifts = wrote["drifts"]
+    wrote_coredrift = wrote["coredrift"]
+    wrote_specdrift = wrote.get("specdrift", False)
+    wrote_datadrift = wrote.get("datadrift", False)
+    wrote_archdrift = wrote.get("archdrift", False)
+    wrote_depsdrift = wrote.get("depsdrift", False)
+    wrote_uxdrift = wrote.get("uxdrift", False)
+    wrote_therapydrift = wrote.get("therapydrift", False)
+    wrote_fixdrift = wrote.get("fixdrift", False)
+    wrote_yagnidrift = wrote.get("yagnidrift", False)
+    wrote_redrift = wrote.get("redrift", False)
+    wrote_qadrift = wrote["qadrift"]
+    wrote_debatedrift = wrote["debatedrift"]
+    wrote_modelrift = wrote["modelrift"]
+    wrote_surfacedrift = wrote["surfacedrift"]
 
     wrote_amplifier_executor = False
     wrote_amplifier_runner = False
@@ -310,27 +289,23 @@ def cmd_install(args: argparse.Namespace) -> int:
     if bool(getattr(args, "with_lessons_mcp", False)):
         install_lessons_mcp_config(wg_dir)
 
-    updated_gitignore = ensure_coredrift_gitignore(wg_dir)
-    if specdrift_bin is not None:
-        updated_gitignore = ensure_specdrift_gitignore(wg_dir) or updated_gitignore
-    if datadrift_bin is not None:
-        updated_gitignore = ensure_datadrift_gitignore(wg_dir) or updated_gitignore
-    if archdrift_bin is not None:
-        updated_gitignore = ensure_archdrift_gitignore(wg_dir) or updated_gitignore
-    if depsdrift_bin is not None:
-        updated_gitignore = ensure_depsdrift_gitignore(wg_dir) or updated_gitignore
-    if include_uxdrift:
-        updated_gitignore = ensure_uxdrift_gitignore(wg_dir) or updated_gitignore
-    if include_therapydrift:
-        updated_gitignore = ensure_therapydrift_gitignore(wg_dir) or updated_gitignore
-    if include_fixdrift:
-        updated_gitignore = ensure_fixdrift_gitignore(wg_dir) or updated_gitignore
-    if include_yagnidrift:
-        updated_gitignore = ensure_yagnidrift_gitignore(wg_dir) or updated_gitignore
-    if include_redrift:
-        updated_gitignore = ensure_redrift_gitignore(wg_dir) or updated_gitignore
-    updated_gitignore = ensure_qadrift_gitignore(wg_dir) or updated_gitignore
-    updated_gitignore = ensure_debatedrift_gitignore(wg_dir) or updated_gitignore
+    gitignore_entries = [".coredrift/"]
+    for tool, enabled in (
+        ("specdrift", specdrift_bin is not None),
+        ("datadrift", datadrift_bin is not None),
+        ("archdrift", archdrift_bin is not None),
+        ("depsdrift", depsdrift_bin is not None),
+        ("uxdrift", include_uxdrift),
+        ("therapydrift", include_therapydrift),
+        ("fixdrift", include_fixdrift),
+        ("yagnidrift", include_yagnidrift),
+        ("redrift", include_redrift),
+        ("qadrift", True),
+        ("debatedrift", True),
+    ):
+        if enabled:
+            gitignore_entries.append(f".{tool}/")
+    updated_gitignore = ensure_gitignore_entries(wg_dir, gitignore_entries)
 
     created_executor, patched_executors = ensure_executor_guidance(
         wg_dir,
@@ -355,7 +330,9 @@ def cmd_install(args: argparse.Namespace) -> int:
     ensured_contracts = False
     if not args.no_ensure_contracts:
         # Delegate to coredrift, since it owns the wg-contract format and defaults.
-        subprocess.check_call([str(wg_dir / "coredrift"), "--dir", str(project_dir), "ensure-contracts", "--apply"])
+        # Call the resolved binary directly rather than through the wrapper we
+        # just wrote, saving a shell hop.
+        subprocess.check_call([str(coredrift_bin), "--dir", str(project_dir), "ensure-contracts", "--apply"])
         ensured_contracts = True
 
     result = InstallResult(
@@ -390,7 +367,7 @@ def cmd_install(args: argparse.Namespace) -> int:
         ensured_contracts=ensured_contracts,
     )
     if args.json:
-        import json
+        from dataclasses import asdict
 
         print(json.dumps(asdict(result), indent=2, sort_keys=False))
     else:
@@ -6,6 +6,8 @@ from __future__ import annotations
 import argparse
 import io
 import json
+import os
+import re
 import subprocess
 import sys
 from contextlib import redirect_stdout
@@ -18,10 +20,9 @@ from driftdriver.health import (
     rank_ready_drift_queue,
 )
 from driftdriver.policy import load_drift_policy
-from driftdriver.workgraph import find_workgraph_dir, load_workgraph
 
 from .check import ExitCode, _run, cmd_check
-from ._helpers import _normalize_actions
+from ._helpers import _find_wg_dir, _load_wg_cached, _normalize_actions
 
 
 def _invoke_check_json(args: argparse.Namespace) -> tuple[int, dict[str, Any]]:
@@ -52,8 +53,8 @@ def cmd_run(args: argparse.Namespace) -> int:
     )
     rc, check_report = _invoke_check_json(check_args)
 
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
-    wg = load_workgraph(wg_dir)
+    wg_dir = _find_wg_dir(args.dir)
+    wg = _load_wg_cached(wg_dir)
     tasks = list(wg.tasks.values())
     max_next = int(getattr(args, "max_next", 3))
     if max_next < 1:
@@ -99,6 +100,29 @@ def cmd_run(args: argparse.Namespace) -> int:
     return int(rc)
 
 
+# Matches the body of a pinned wrapper written by install.write_tool_wrapper.
+_PINNED_WRAPPER_RE = re.compile(r'\A#!/usr/bin/env bash\nset -euo pipefail\n\nexec "([^"]+)" "\$@"\n\Z')
+
+
+def _unwrap_pinned_wrapper(wrapper: Path) -> Path:
+    """Return the tool a pinned ``.workgraph/<tool>`` wrapper execs, else the wrapper.
+
+    Pinned wrappers are a bash pass-through; invoking the target directly saves a
+    shell start. Portable wrappers and anything hand-edited are left alone.
+    """
+    try:
+        content = wrapper.read_text(encoding="utf-8")
+    except OSError:
+        return wrapper
+    m = _PINNED_WRAPPER_RE.match(content)
+    if not m:
+        return wrapper
+    target = Path(m.group(1))
+    if target.is_file() and os.access(target, os.X_OK):
+        return target
+    return wrapper
+
+
 def cmd_orchestrate(args: argparse.Namespace) -> int:
     """
     Run drift "pit wall" loops.
@@ -106,7 +130,7 @@ def cmd_orchestrate(args: argparse.Namespace) -> int:
     Today this delegates to baseline coredrift's monitor+redirect orchestrator.
     """
 
-    wg_dir = find_workgraph_dir(Path(args.dir) if args.dir else None)
+    wg_dir = _find_wg_dir(args.dir)
     project_dir = wg_dir.parent
 
     coredrift = wg_dir / "coredrift"
@@ -115,14 +139,14 @@ def cmd_orchestrate(args: argparse.Namespace) -> int:
         return ExitCode.usage
 
     cmd = [
-        str(coredrift),
+        str(_unwrap_pinned_wrapper(coredrift)),
         "--dir",
         str(project_dir),
         "orchestrate",
         "--interval",
-        str(int(args.interval)),
+        str(args.interval),
         "--redirect-interval",
-        str(int(args.redirect_interval)),
+        str(args.redirect_interval),
     ]
     if args.write_log:
         cmd.append("--write-log")
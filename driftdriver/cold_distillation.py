@@ -5,6 +5,7 @@ import math
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
 
 
 @dataclass
@@ -33,11 +34,12 @@ def summarize_cluster(event_type: str, events: list[dict]) -> dict | None:
     if len(events) < 3:
         return None
 
-    word_counts: Counter = Counter()
-    for event in events:
-        content = event.get("content", event.get("message", ""))
-        words = set(content.lower().split())
-        word_counts.update(words)
+    # Each event contributes a word at most once; one Counter pass over all of them.
+    word_counts: Counter = Counter(
+        chain.from_iterable(
+            set(event.get("content", event.get("message", "")).lower().split()) for event in events
+        )
+    )
 
     common_terms = [w for w, count in word_counts.most_common() if count >= 2][:5]
     terms_str = ", ".join(common_terms) if common_terms else event_type
@@ -50,16 +52,10 @@ def summarize_cluster(event_type: str, events: list[dict]) -> dict | None:
 
 
 def identify_patterns(knowledge_entries: list[dict]) -> list[dict]:
-    """Find entries that appear in category clusters of 2 or more."""
-    by_category: dict[str, list[dict]] = defaultdict(list)
-    for entry in knowledge_entries:
-        by_category[entry.get("category", "")].append(entry)
-
-    patterns = []
-    for entries in by_category.values():
-        if len(entries) >= 2:
-            patterns.extend(entries)
-    return patterns
+    """Find entries that appear in category clusters of 2 or more, in input order."""
+    counts = Counter(entry.get("category", "") for entry in knowledge_entries)
+    repeated = {category for category, n in counts.items() if n >= 2}
+    return [entry for entry in knowledge_entries if entry.get("category", "") in repeated]
 
 
 def prune_low_confidence(
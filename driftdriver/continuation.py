@@ -2,6 +2,7 @@
 # ABOUTME: Decides whether a stopped agent should CONTINUE, STOP, or ESCALATE.
 from __future__ import annotations
 
+import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -16,6 +17,18 @@ class ContinuationDecision:
 
 
 _STATE_FILE = ".continuation-state"
+# record_continuation rewrites the state file with only the last hour of
+# timestamps once it grows past this many lines, so it stays bounded.
+# Throttle windows longer than the retention period would under-count.
+_STATE_COMPACT_LINES = 64
+_STATE_RETENTION_SECONDS = 3600
+
+
+def _safe_float(s: str) -> float | None:
+    try:
+        return float(s)
+    except (ValueError, TypeError):
+        return None
 
 
 def check_throttle(state_dir: Path, window_seconds: int = 300, max_continuations: int = 3) -> bool:
@@ -23,17 +36,9 @@ def check_throttle(state_dir: Path, window_seconds: int = 300, max_continuations
     state_file = state_dir / _STATE_FILE
     if not state_file.exists():
         return False
-    now = time.time()
-    cutoff = now - window_seconds
-    def _safe_float(s: str) -> float | None:
-        try:
-            return float(s)
-        except (ValueError, TypeError):
-            return None
-
-    lines = state_file.read_text(encoding="utf-8").splitlines()
+    cutoff = time.time() - window_seconds
     recent = []
-    for ts in lines:
+    for ts in state_file.read_text(encoding="utf-8").splitlines():
         val = _safe_float(ts.strip())
         if val is not None and val >= cutoff:
             recent.append(val)
@@ -41,10 +46,24 @@ def check_throttle(state_dir: Path, window_seconds: int = 300, max_continuations
 
 
 def record_continuation(state_dir: Path) -> None:
-    """Append the current timestamp to the state file."""
+    """Append the current timestamp to the state file, compacting it when long."""
     state_file = state_dir / _STATE_FILE
-    with state_file.open("a", encoding="utf-8") as fh:
-        fh.write(f"{time.time()}\n")
+    now = time.time()
+    try:
+        lines = state_file.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        lines = []
+    if len(lines) < _STATE_COMPACT_LINES:
+        with state_file.open("a", encoding="utf-8") as fh:
+            fh.write(f"{now}\n")
+        return
+    # Replace atomically so concurrent readers never see a truncated file.
+    keep_after = now - _STATE_RETENTION_SECONDS
+    kept = [ts.strip() for ts in lines if (val := _safe_float(ts.strip())) is not None and val >= keep_after]
+    kept.append(str(now))
+    tmp = state_file.with_name(f"{_STATE_FILE}.{os.getpid()}.tmp")
+    tmp.write_text("".join(f"{ts}\n" for ts in kept), encoding="utf-8")
+    os.replace(tmp, state_file)
 
 
 def evaluate_continuation(
@@ -84,7 +103,8 @@ def evaluate_continuation(
     # Task is in_progress — check if checklist is complete
     checklist = task_contract.get("checklist", [])
     checklist_done = task_contract.get("checklist_done", [])
-    all_done = len(checklist) > 0 and set(checklist_done) >= set(checklist)
+    done_set = frozenset(checklist_done)
+    all_done = len(checklist) > 0 and all(item in done_set for item in checklist)
 
     if all_done:
         return ContinuationDecision(
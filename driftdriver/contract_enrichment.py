@@ -1,6 +1,7 @@
 # ABOUTME: Auto-injects relevant Lessons MCP learnings into task contracts
 # ABOUTME: Enriches wg-contract blocks when tasks are claimed
 
+import heapq
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -30,13 +31,12 @@ def find_relevant_learnings(
 
     scored: list[tuple[int, dict]] = []
     for entry in knowledge_entries:
-        content_words = {w.lower() for w in entry.get("content", "").split()}
+        content_words = set(entry.get("content", "").lower().split())
         score = len(words & content_words)
         if score > 0:
             scored.append((score, entry))
 
-    scored.sort(key=lambda t: t[0], reverse=True)
-    return [entry for _, entry in scored[:max_entries]]
+    return [entry for _, entry in heapq.nlargest(max_entries, scored, key=lambda t: t[0])]
 
 
 def format_context_block(learnings: list[dict]) -> str:
@@ -13,6 +13,7 @@ from typing import Any
 from driftdriver.actor import Actor
 from driftdriver.authority import Budget, can_do, check_budget, get_budget, load_authority_policy
 from driftdriver.budget_ledger import recent_count, record_operation
+from driftdriver.workgraph import load_workgraph
 
 # Default global ceiling — hard safety net across all lanes.
 # Authority budgets handle per-actor limits; this prevents runaway across lanes.
@@ -135,15 +136,31 @@ def _run_wg(
     return int(proc.returncode), str(proc.stdout or "").strip(), str(proc.stderr or "").strip()
 
 
+def _task_in_graph(wg_dir: Path, task_id: str) -> bool | None:
+    """Whether graph.jsonl holds ``task_id``; None when the graph can't be read."""
+    try:
+        wg = load_workgraph(wg_dir)
+    except (OSError, UnicodeDecodeError, AttributeError):
+        # AttributeError: a valid-JSON line that is not an object.
+        return None
+    return task_id in wg.tasks
+
+
 def _load_task_list(wg_dir: Path, *, cwd: Path | None = None) -> list[dict[str, Any]]:
     """Load the full task list from wg, returning [] on failure."""
-    rc, out, _ = _run_wg(
+    tasks = _query_task_list(wg_dir, cwd=cwd)
+    return tasks if tasks is not None else []
+
+
+def _query_task_list(wg_dir: Path, *, cwd: Path | None = None) -> list[dict[str, Any]] | None:
+    """Like _load_task_list, but None when ``wg list`` timed out (wg is hung)."""
+    rc, out, err = _run_wg(
         ["wg", "--dir", str(wg_dir), "--json", "list"],
         cwd=cwd,
         timeout=30.0,
     )
     if rc != 0:
-        return []
+        return None if "timed out" in err.lower() else []
     try:
         tasks = json.loads(out)
     except (json.JSONDecodeError, TypeError):
@@ -273,22 +290,30 @@ def guarded_add_drift_task(
         return "unauthorized"
 
     # 4. Dedup — if this exact task_id already exists in any state, skip.
-    #    Use a short timeout.  If wg hangs (stale graph.lock, broken service),
-    #    return "error" immediately instead of cascading into more wg calls
-    #    that will also hang and eventually crash the factory execution cycle.
-    show_rc, _, show_err = _run_wg(
-        ["wg", "--dir", str(wg_dir), "show", task_id, "--json"],
-        cwd=cwd,
-        timeout=10.0,
-    )
-    if show_rc == 0:
+    #    Answer from graph.jsonl when it is readable; otherwise ask wg with a
+    #    short timeout, returning "error" if it hangs (stale graph.lock).
+    #    A readable graph skips that probe, so a hung wg is caught by the
+    #    task-list load in step 5 instead.
+    in_graph = _task_in_graph(wg_dir, task_id)
+    if in_graph:
         return "existing"
-    if "timed out" in show_err.lower():
+    if in_graph is None:
+        show_rc, _, show_err = _run_wg(
+            ["wg", "--dir", str(wg_dir), "show", task_id, "--json"],
+            cwd=cwd,
+            timeout=10.0,
+        )
+        if show_rc == 0:
+            return "existing"
+        if "timed out" in show_err.lower():
+            return "error"
+
+    # 5. Load task list once (used for per-lane and global counts).  A timed-out
+    #    list must not read as zero active tasks, or the budgets below pass.
+    tasks = _query_task_list(wg_dir, cwd=cwd)
+    if tasks is None:
         return "error"
 
-    # 5. Load task list once (used for per-lane and global counts).
-    tasks = _load_task_list(wg_dir, cwd=cwd)
-
     # 6. Quality-adjusted budget check.
     effective_policy = _apply_quality_modifier(wg_dir, actor, policy)
     active_in_lane = count_active_drift_tasks(wg_dir, lane_tag, _tasks=tasks)
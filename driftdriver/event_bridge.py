@@ -6,6 +6,7 @@ import json
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Iterator
 
 _EVENT_TYPE_MAP = {
     "pre_tool_use": "tool_use",
@@ -16,7 +17,7 @@ _EVENT_TYPE_MAP = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class MappedEvent:
     session_id: str
     event_type: str  # decision, error, observation, tool_use
@@ -50,25 +51,26 @@ def map_event(raw_event: dict, session_id: str, project: str) -> MappedEvent | N
     )
 
 
-def parse_events_file(events_file: Path) -> list[dict]:
-    """Read a JSONL file and return a list of parsed event dicts, skipping malformed lines."""
-    events = []
-    with events_file.open() as f:
+def iter_events_file(events_file: Path) -> Iterator[dict]:
+    """Yield parsed event dicts from a JSONL file one line at a time, skipping malformed lines."""
+    with events_file.open("rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if not line.strip():
                 continue
             try:
-                events.append(json.loads(line))
-            except json.JSONDecodeError:
+                yield json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 pass
-    return events
+
+
+def parse_events_file(events_file: Path) -> list[dict]:
+    """Read a JSONL file and return a list of parsed event dicts, skipping malformed lines."""
+    return list(iter_events_file(events_file))
 
 
 def bridge_events(events_file: Path, session_id: str, project: str) -> list[MappedEvent]:
     """Parse events file and map all events, filtering out unmapped ones."""
-    raw_events = parse_events_file(events_file)
-    mapped = [map_event(e, session_id=session_id, project=project) for e in raw_events]
+    mapped = (map_event(e, session_id=session_id, project=project) for e in iter_events_file(events_file))
     return [m for m in mapped if m is not None]
 
 
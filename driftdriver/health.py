@@ -1,17 +1,29 @@
 from __future__ import annotations
 
 import re
-from collections import defaultdict
+import time
 from datetime import datetime, timezone
-from typing import Any
-
-
-_DRIFT_ID_RE = re.compile(
-    r"^(drift-|coredrift-|specdrift-|datadrift-|archdrift-|depsdrift-|uxdrift-|therapydrift-|fixdrift-|yagnidrift-|redrift-|speedrift-)"
+from typing import Any, Iterator
+
+
+_DRIFT_ID_PREFIXES = (
+    "drift-",
+    "coredrift-",
+    "specdrift-",
+    "datadrift-",
+    "archdrift-",
+    "depsdrift-",
+    "uxdrift-",
+    "therapydrift-",
+    "fixdrift-",
+    "yagnidrift-",
+    "redrift-",
+    "speedrift-",
 )
 _DRIFT_WORD_RE = re.compile(r"\bdrift\b", re.IGNORECASE)
 _DRIFT_TAG_RE = re.compile(r"drift|therapy|fix|yagni|redrift")
 _REDRIFT_PREFIX_RE = re.compile(r"^(redrift (analyze|respec|design|build|execute|exec):\s*)+", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def task_status(task: dict[str, Any]) -> str:
@@ -30,11 +42,13 @@ def has_contract(task: dict[str, Any]) -> bool:
 
 def is_drift_task(task: dict[str, Any]) -> bool:
     task_id = str(task.get("id") or "")
-    if _DRIFT_ID_RE.search(task_id):
+    if task_id.startswith(_DRIFT_ID_PREFIXES):
         return True
 
     title = str(task.get("title") or "")
-    if _DRIFT_WORD_RE.search(title):
+    # Substring test first: most titles never mention drift. Non-ASCII titles
+    # go straight to the regex, whose case folding matches dotted/dotless i.
+    if ("drift" in title.lower() or not title.isascii()) and _DRIFT_WORD_RE.search(title):
         return True
 
     tags = task.get("tags")
@@ -68,27 +82,34 @@ def detect_cycle_from(task_id: str, tasks_by_id: dict[str, dict[str, Any]]) -> b
     if not target:
         return False
 
-    visited: set[str] = set()
-    stack: set[str] = set()
-
-    def _dfs(cur: str) -> bool:
-        if cur in stack:
-            return True
-        if cur in visited:
-            return False
-        visited.add(cur)
-        stack.add(cur)
+    def _blockers(cur: str) -> Iterator[Any]:
         node = tasks_by_id.get(cur)
         if isinstance(node, dict):
             blockers = node.get("blocked_by")
             if isinstance(blockers, list):
-                for blocker in blockers:
-                    if _dfs(str(blocker)):
-                        return True
-        stack.remove(cur)
-        return False
-
-    return _dfs(target)
+                return iter(blockers)
+        return iter(())
+
+    # Iterative DFS: each frame holds a node and its remaining blockers, so deep
+    # blocker chains never hit the interpreter recursion limit.
+    visited: set[str] = {target}
+    stack: set[str] = {target}
+    frames: list[tuple[str, Iterator[Any]]] = [(target, _blockers(target))]
+    while frames:
+        cur, pending = frames[-1]
+        for blocker in pending:
+            nxt = str(blocker)
+            if nxt in stack:
+                return True
+            if nxt not in visited:
+                visited.add(nxt)
+                stack.add(nxt)
+                frames.append((nxt, _blockers(nxt)))
+                break
+        else:
+            frames.pop()
+            stack.discard(cur)
+    return False
 
 
 def normalize_drift_key(task: dict[str, Any]) -> str:
@@ -96,26 +117,38 @@ def normalize_drift_key(task: dict[str, Any]) -> str:
     task_id = str(task.get("id") or "").strip().lower()
     if title:
         title = _REDRIFT_PREFIX_RE.sub("", title)
-        title = re.sub(r"\s+", " ", title).strip()
+        title = _WHITESPACE_RE.sub(" ", title).strip()
     return title or task_id
 
 
+def _active_drift_tasks(tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [t for t in tasks if is_drift_task(t) and is_active(t)]
+
+
 def find_duplicate_open_drift_groups(tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    groups: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    for task in tasks:
-        if not is_drift_task(task):
-            continue
-        if not is_active(task):
-            continue
+    return _duplicate_groups(_active_drift_tasks(tasks))
+
+
+def _duplicate_groups(active_drift: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Group already-filtered active drift tasks by normalized key."""
+    # Most keys are unique, so hold singletons bare and only build a list once
+    # a key repeats.
+    first_seen: dict[str, dict[str, Any]] = {}
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for task in active_drift:
         key = normalize_drift_key(task)
         if not key:
             continue
-        groups[key].append(task)
+        grouped = groups.get(key)
+        if grouped is not None:
+            grouped.append(task)
+        elif key in first_seen:
+            groups[key] = [first_seen[key], task]
+        else:
+            first_seen[key] = task
 
     out: list[dict[str, Any]] = []
     for key, grouped in groups.items():
-        if len(grouped) <= 1:
-            continue
         out.append(
             {
                 "key": key,
@@ -142,7 +175,7 @@ def _task_epoch(task: dict[str, Any]) -> int:
     return int(dt.timestamp())
 
 
-def _future_not_before(task: dict[str, Any]) -> bool:
+def _future_not_before(task: dict[str, Any], now_ts: int) -> bool:
     raw = str(task.get("not_before") or "").strip()
     if not raw:
         return False
@@ -154,52 +187,68 @@ def _future_not_before(task: dict[str, Any]) -> bool:
         return False
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    return int(dt.timestamp()) > int(datetime.now(timezone.utc).timestamp())
+    return int(dt.timestamp()) > now_ts
+
+
+# Ready-queue priority by task id prefix, checked in order. A missing_contract
+# title (85) ranks below the escalation prefixes and above the rest.
+_ESCALATION_PREFIX_PRIORITY: tuple[tuple[str, int], ...] = (
+    ("drift-breaker-", 100),
+    ("coredrift-pit-", 90),
+)
+_MISSING_CONTRACT_PRIORITY = 85
+_FOLLOWUP_PREFIX_PRIORITY: tuple[tuple[str, int], ...] = (
+    ("drift-harden-", 80),
+    ("drift-fix-", 75),
+    ("drift-scope-", 70),
+    ("redrift-", 60),
+)
 
 
 def _queue_priority(task: dict[str, Any]) -> int:
     task_id = str(task.get("id") or "")
-    title = str(task.get("title") or "").lower()
-    if task_id.startswith("drift-breaker-"):
-        return 100
-    if task_id.startswith("coredrift-pit-"):
-        return 90
-    if "missing_contract" in title:
-        return 85
-    if task_id.startswith("drift-harden-"):
-        return 80
-    if task_id.startswith("drift-fix-"):
-        return 75
-    if task_id.startswith("drift-scope-"):
-        return 70
-    if task_id.startswith("redrift-"):
-        return 60
+    for prefix, priority in _ESCALATION_PREFIX_PRIORITY:
+        if task_id.startswith(prefix):
+            return priority
+    if "missing_contract" in str(task.get("title") or "").lower():
+        return _MISSING_CONTRACT_PRIORITY
+    for prefix, priority in _FOLLOWUP_PREFIX_PRIORITY:
+        if task_id.startswith(prefix):
+            return priority
     return 50
 
 
 def rank_ready_drift_queue(tasks: list[dict[str, Any]], *, limit: int = 10) -> list[dict[str, Any]]:
     tasks_by_id = {str(t.get("id") or ""): t for t in tasks}
-    ready: list[dict[str, Any]] = []
-    for task in tasks:
-        if not is_drift_task(task):
-            continue
-        if not is_active(task):
-            continue
-        if _future_not_before(task):
+    return _rank_ready(_active_drift_tasks(tasks), tasks_by_id, limit)
+
+
+def _rank_ready(
+    active_drift: list[dict[str, Any]],
+    tasks_by_id: dict[str, dict[str, Any]],
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Rank already-filtered active drift tasks whose blockers are done."""
+    now_ts = int(time.time())
+    # Decorate with (priority, task) so the priority computed for the sort key
+    # is reused in the output rows.
+    ready: list[tuple[int, dict[str, Any]]] = []
+    for task in active_drift:
+        if _future_not_before(task, now_ts):
             continue
         if not blockers_done(task, tasks_by_id):
             continue
-        ready.append(task)
+        ready.append((_queue_priority(task), task))
 
-    ready.sort(key=lambda t: (-_queue_priority(t), _task_epoch(t), str(t.get("id") or "")))
+    ready.sort(key=lambda pt: (-pt[0], _task_epoch(pt[1]), str(pt[1].get("id") or "")))
     out: list[dict[str, Any]] = []
-    for task in ready[: max(1, int(limit))]:
+    for priority, task in ready[: max(1, int(limit))]:
         out.append(
             {
                 "task_id": str(task.get("id") or ""),
                 "title": str(task.get("title") or ""),
                 "status": task_status(task),
-                "priority": _queue_priority(task),
+                "priority": priority,
                 "created_at": str(task.get("created_at") or ""),
                 "blocked_by": [str(x) for x in (task.get("blocked_by") or []) if str(x)],
             }
@@ -208,13 +257,27 @@ def rank_ready_drift_queue(tasks: list[dict[str, Any]], *, limit: int = 10) -> l
 
 
 def compute_scoreboard(tasks: list[dict[str, Any]]) -> dict[str, Any]:
-    active = [t for t in tasks if is_active(t)]
-    drift = [t for t in tasks if is_drift_task(t)]
-    active_drift = [t for t in drift if is_active(t)]
-    ready = rank_ready_drift_queue(tasks, limit=10_000)
-
-    active_with_contract = sum(1 for t in active if has_contract(t))
-    active_total = len(active)
+    # One pass builds the id index and the active/drift tallies.
+    tasks_by_id: dict[str, dict[str, Any]] = {}
+    active_drift: list[dict[str, Any]] = []
+    active_total = 0
+    active_with_contract = 0
+    drift_total = 0
+    for t in tasks:
+        tasks_by_id[str(t.get("id") or "")] = t
+        drift = is_drift_task(t)
+        if drift:
+            drift_total += 1
+        if is_active(t):
+            active_total += 1
+            if has_contract(t):
+                active_with_contract += 1
+            if drift:
+                active_drift.append(t)
+
+    # The loop above already classified every task; skip the public wrappers'
+    # re-filtering and rank/group the active drift subset directly.
+    ready = _rank_ready(active_drift, tasks_by_id, 10_000)
     contract_coverage = (active_with_contract / active_total) if active_total else 1.0
 
     max_depth = 0
@@ -224,7 +287,7 @@ def compute_scoreboard(tasks: list[dict[str, Any]]) -> dict[str, Any]:
             continue
         max_depth = max(max_depth, redrift_depth(task_id))
 
-    duplicate_groups = find_duplicate_open_drift_groups(tasks)
+    duplicate_groups = _duplicate_groups(active_drift)
     active_ratio = (len(active_drift) / active_total) if active_total else 0.0
 
     status = "healthy"
@@ -237,7 +300,7 @@ def compute_scoreboard(tasks: list[dict[str, Any]]) -> dict[str, Any]:
         "status": status,
         "tasks_total": len(tasks),
         "active_tasks": active_total,
-        "drift_total": len(drift),
+        "drift_total": drift_total,
         "active_drift": len(active_drift),
         "ready_drift": len(ready),
         "active_contract_coverage": round(contract_coverage, 4),
@@ -7,6 +7,7 @@ import shutil
 import stat
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable
 
 CODEX_ADAPTER_MARKER = "## Driftdriver Integration Protocol"
 CODEX_ADAPTER_START = "<!-- driftdriver-codex:start -->"
@@ -139,22 +140,32 @@ class InstallResult:
     ensured_contracts: bool
 
 
-def _ensure_line_in_file(path: Path, line: str) -> bool:
+def _ensure_lines_in_file(path: Path, lines: Iterable[str]) -> bool:
     existing = ""
     if path.exists():
         existing = path.read_text(encoding="utf-8")
-    lines = existing.splitlines()
-    if any(l.strip() == line for l in lines):
+    present = {l.strip() for l in existing.splitlines()}
+    missing = [line for line in dict.fromkeys(lines) if line not in present]
+    if not missing:
         return False
     new = existing.rstrip("\n")
     if new:
         new += "\n"
-    new += line + "\n"
+    new += "\n".join(missing) + "\n"
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(new, encoding="utf-8")
     return True
 
 
+def _ensure_line_in_file(path: Path, line: str) -> bool:
+    return _ensure_lines_in_file(path, (line,))
+
+
+def ensure_gitignore_entries(wg_dir: Path, entries: Iterable[str]) -> bool:
+    """Add any missing ``entries`` to .workgraph/.gitignore in one read and write."""
+    return _ensure_lines_in_file(wg_dir / ".gitignore", entries)
+
+
 def ensure_coredrift_gitignore(wg_dir: Path) -> bool:
     return _ensure_line_in_file(wg_dir / ".gitignore", ".coredrift/")
 
@@ -252,11 +263,8 @@ def write_tool_wrapper(
             f'exec "{tool_bin}" "$@"\n'
         )
 
-    existing = wrapper.read_text(encoding="utf-8") if wrapper.exists() else None
-    changed = existing != content
-    if changed:
-        wrapper.write_text(content, encoding="utf-8")
-    wrapper.chmod(wrapper.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    changed = _write_text_if_changed(wrapper, content)
+    _make_executable(wrapper)
     return changed
 
 
@@ -303,12 +311,8 @@ def write_qadrift_wrapper(wg_dir: Path) -> bool:
         return False
     content = template.read_text(encoding="utf-8")
     wrapper = wg_dir / "qadrift"
-    existing = wrapper.read_text(encoding="utf-8") if wrapper.exists() else None
-    changed = existing != content
-    if changed:
-        wrapper.parent.mkdir(parents=True, exist_ok=True)
-        wrapper.write_text(content, encoding="utf-8")
-    wrapper.chmod(wrapper.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    changed = _write_text_if_changed(wrapper, content)
+    _make_executable(wrapper)
     return changed
 
 
@@ -322,12 +326,8 @@ def write_debatedrift_wrapper(wg_dir: Path) -> bool:
         "python3 -m driftdriver.debatedrift \"$@\"\n"
     )
     wrapper = wg_dir / "debatedrift"
-    existing = wrapper.read_text(encoding="utf-8") if wrapper.exists() else None
-    changed = existing != content
-    if changed:
-        wrapper.parent.mkdir(parents=True, exist_ok=True)
-        wrapper.write_text(content, encoding="utf-8")
-    wrapper.chmod(wrapper.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    changed = _write_text_if_changed(wrapper, content)
+    _make_executable(wrapper)
     return changed
 
 
@@ -341,12 +341,8 @@ def write_modelrift_wrapper(wg_dir: Path) -> bool:
         "python3 -m driftdriver.modelrift \"$@\"\n"
     )
     wrapper = wg_dir / "modelrift"
-    existing = wrapper.read_text(encoding="utf-8") if wrapper.exists() else None
-    changed = existing != content
-    if changed:
-        wrapper.parent.mkdir(parents=True, exist_ok=True)
-        wrapper.write_text(content, encoding="utf-8")
-    wrapper.chmod(wrapper.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    changed = _write_text_if_changed(wrapper, content)
+    _make_executable(wrapper)
     return changed
 
 
@@ -360,12 +356,8 @@ def write_surfacedrift_wrapper(wg_dir: Path) -> bool:
         "python3 -m driftdriver.surfacedrift \"$@\"\n"
     )
     wrapper = wg_dir / "surfacedrift"
-    existing = wrapper.read_text(encoding="utf-8") if wrapper.exists() else None
-    changed = existing != content
-    if changed:
-        wrapper.parent.mkdir(parents=True, exist_ok=True)
-        wrapper.write_text(content, encoding="utf-8")
-    wrapper.chmod(wrapper.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    changed = _write_text_if_changed(wrapper, content)
+    _make_executable(wrapper)
     return changed
 
 
@@ -382,11 +374,8 @@ def write_drifts_wrapper(wg_dir: Path) -> bool:
         "exec \"$WG_DIR/driftdriver\" \"$@\"\n"
     )
 
-    existing = wrapper.read_text(encoding="utf-8") if wrapper.exists() else None
-    changed = existing != content
-    if changed:
-        wrapper.write_text(content, encoding="utf-8")
-    wrapper.chmod(wrapper.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    changed = _write_text_if_changed(wrapper, content)
+    _make_executable(wrapper)
     return changed
 
 
@@ -890,6 +879,22 @@ def ensure_executor_guidance(
     return (created, patched)
 
 
+# Only hits are remembered: a miss is re-probed so a tool installed mid-process
+# is still found.
+_WHICH_HITS: dict[tuple[str, str | None], str] = {}
+
+
+def which_cached(name: str) -> str | None:
+    """``shutil.which`` with hits memoized per (name, $PATH) for repeated install-time lookups."""
+    key = (name, os.environ.get("PATH"))
+    hit = _WHICH_HITS.get(key)
+    if hit is None:
+        hit = shutil.which(name, path=key[1])
+        if hit is not None:
+            _WHICH_HITS[key] = hit
+    return hit
+
+
 def resolve_bin(
     *,
     explicit: Path | None,
@@ -914,7 +919,7 @@ def resolve_bin(
             return out
 
     if which_name:
-        w = shutil.which(which_name)
+        w = which_cached(which_name)
         if w:
             out = _ok(Path(w))
             if out:
@@ -945,7 +950,10 @@ def _template_text(*parts: str) -> str:
 
 
 def _make_executable(path: Path) -> None:
-    path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    mode = path.stat().st_mode
+    wanted = mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+    if wanted != mode:
+        path.chmod(wanted)
 
 
 def install_claude_executor_support(wg_dir: Path) -> tuple[bool, bool]:
@@ -1058,7 +1066,7 @@ def ensure_amplifier_executor(wg_dir: Path, *, bundle_name: str = "speedrift") -
         "\"${EXTRA_ARGS[@]+${EXTRA_ARGS[@]}}\" \"$PROMPT\"\n"
     )
     wrote_runner = _write_text_if_changed(runner, runner_text)
-    runner.chmod(runner.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    _make_executable(runner)
 
     executor = executors_dir / "amplifier.toml"
     executor_text = (
@@ -1154,7 +1162,7 @@ def ensure_amplifier_autostart_hook(project_dir: Path) -> tuple[bool, bool]:
         "exit 0\n"
     )
     wrote_script = _write_text_if_changed(hook_script, hook_script_text)
-    hook_script.chmod(hook_script.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    _make_executable(hook_script)
 
     hook_json = hook_dir / "hooks.json"
     hook_json_text = (
@@ -1201,7 +1209,7 @@ def install_handler_scripts(wg_dir: Path) -> tuple[bool, int]:
         if existing != content:
             dst.write_bytes(content)
             written += 1
-        dst.chmod(dst.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        _make_executable(dst)
 
     return (written > 0, written)
 
@@ -1231,7 +1239,7 @@ def install_hook_scripts(wg_dir: Path) -> tuple[bool, int]:
         if existing != content:
             dst.write_bytes(content)
             written += 1
-        dst.chmod(dst.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        _make_executable(dst)
 
     return (written > 0, written)
 
@@ -1257,7 +1265,7 @@ def install_session_driver_executor(wg_dir: Path) -> tuple[bool, bool]:
     sh_src = templates / "session-driver-run.sh"
     sh_dst = executors_dir / "session-driver-run.sh"
     wrote_script = _write_text_if_changed(sh_dst, sh_src.read_text(encoding="utf-8"))
-    sh_dst.chmod(sh_dst.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    _make_executable(sh_dst)
 
     return (wrote_toml, wrote_script)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 from datetime import datetime, timedelta, timezone
 from hashlib import sha1
@@ -244,15 +245,19 @@ def _merge_history_points(*groups: list[dict[str, Any]]) -> list[dict[str, Any]]
 
 def _read_daily_history(root: Path, *, limit: int) -> list[dict[str, Any]]:
     daily_dir = root / "daily"
-    if not daily_dir.exists():
+    # One scandir over raw names; Paths are only built for the kept tail.
+    try:
+        with os.scandir(daily_dir) as it:
+            names = sorted(entry.name for entry in it if entry.name.endswith(".json"))
+    except OSError:
         return []
     rows: list[dict[str, Any]] = []
-    for path in sorted(daily_dir.glob("*.json"))[-max(1, int(limit)) :]:
-        payload = _read_json(path)
+    for name in names[-max(1, int(limit)) :]:
+        payload = _read_json(daily_dir / name)
         if not payload:
             continue
         point = _history_point(payload)
-        point["day"] = path.stem
+        point["day"] = name[: -len(".json")]
         rows.append(point)
     return rows
 
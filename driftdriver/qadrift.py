@@ -2,7 +2,10 @@
 # ABOUTME: Runs as a speedrift module, produces drift score and structured findings
 from __future__ import annotations
 
+import io
+import os
 import re
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from hashlib import sha1
@@ -49,13 +52,40 @@ def _collect_test_files(project_dir: Path) -> list[Path]:
     return test_files
 
 
-def find_untested_modules(project_dir: Path) -> list[QAFinding]:
+def _read_test_texts(project_dir: Path) -> dict[Path, str]:
+    """Read every collected test file once; unreadable files are skipped."""
+    texts: dict[Path, str] = {}
+    for tf in _collect_test_files(project_dir):
+        try:
+            texts[tf] = tf.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+    return texts
+
+
+def _collect_src_files(src_dir: Path) -> tuple[list[Path], list[Path]]:
+    """Walk src/ once, returning its (.py, .ts) files."""
+    py_files: list[Path] = []
+    ts_files: list[Path] = []
+    for dirpath, _dirnames, filenames in os.walk(src_dir):
+        for name in filenames:
+            if name.endswith(".py"):
+                py_files.append(Path(dirpath, name))
+            elif name.endswith(".ts"):
+                ts_files.append(Path(dirpath, name))
+    return py_files, ts_files
+
+
+def find_untested_modules(
+    project_dir: Path, *, _src_files: tuple[list[Path], list[Path]] | None = None
+) -> list[QAFinding]:
     """Find .py source files without corresponding test_*.py files."""
     findings: list[QAFinding] = []
 
     src_dir = project_dir / "src"
     if not src_dir.exists():
         return findings
+    py_files, ts_files = _src_files if _src_files is not None else _collect_src_files(src_dir)
 
     test_files = _collect_test_files(project_dir)
     tested_names: set[str] = set()
@@ -64,7 +94,7 @@ def find_untested_modules(project_dir: Path) -> list[QAFinding]:
         if name.startswith("test_"):
             tested_names.add(name[5:])  # strip "test_"
 
-    for py_file in src_dir.rglob("*.py"):
+    for py_file in py_files:
         if py_file.name.startswith("_"):
             continue
         module_name = py_file.stem
@@ -79,12 +109,12 @@ def find_untested_modules(project_dir: Path) -> list[QAFinding]:
             )
 
     # TypeScript: .ts files in src/ without corresponding .test.ts
-    for ts_file in src_dir.rglob("*.ts"):
+    ts_test_names = {ts_file.name for ts_file in ts_files if ts_file.name.endswith(".test.ts")}
+    for ts_file in ts_files:
         if ts_file.name.endswith(".test.ts") or ts_file.name.endswith(".d.ts"):
             continue
         stem = ts_file.stem
-        test_candidates = list(src_dir.rglob(f"{stem}.test.ts"))
-        if not test_candidates:
+        if f"{stem}.test.ts" not in ts_test_names:
             findings.append(
                 QAFinding(
                     file=str(ts_file.relative_to(project_dir)),
@@ -97,16 +127,12 @@ def find_untested_modules(project_dir: Path) -> list[QAFinding]:
     return findings
 
 
-def check_mock_usage(project_dir: Path) -> list[QAFinding]:
+def check_mock_usage(project_dir: Path, *, _test_texts: dict[Path, str] | None = None) -> list[QAFinding]:
     """Scan test files for mock imports that violate no-mock policy."""
     findings: list[QAFinding] = []
 
-    test_files = _collect_test_files(project_dir)
-    for tf in test_files:
-        try:
-            content = tf.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            continue
+    test_texts = _test_texts if _test_texts is not None else _read_test_texts(project_dir)
+    for tf, content in test_texts.items():
         if _MOCK_PATTERNS.search(content):
             findings.append(
                 QAFinding(
@@ -120,17 +146,12 @@ def check_mock_usage(project_dir: Path) -> list[QAFinding]:
     return findings
 
 
-def check_false_confidence(project_dir: Path) -> list[QAFinding]:
+def check_false_confidence(project_dir: Path, *, _test_texts: dict[Path, str] | None = None) -> list[QAFinding]:
     """Detect tests that provide false confidence: import-only, existence, or weak assertions."""
     findings: list[QAFinding] = []
 
-    test_files = _collect_test_files(project_dir)
-    for tf in test_files:
-        try:
-            content = tf.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            continue
-
+    test_texts = _test_texts if _test_texts is not None else _read_test_texts(project_dir)
+    for tf, content in test_texts.items():
         has_import_only = bool(_FALSE_CONFIDENCE_IMPORT.search(content))
         has_weak = bool(_FALSE_CONFIDENCE_WEAK.search(content))
         has_exists = bool(_FALSE_CONFIDENCE_EXISTS.search(content))
@@ -172,7 +193,12 @@ def check_false_confidence(project_dir: Path) -> list[QAFinding]:
     return findings
 
 
-def check_integration_coverage(project_dir: Path) -> list[QAFinding]:
+def check_integration_coverage(
+    project_dir: Path,
+    *,
+    _test_texts: dict[Path, str] | None = None,
+    _src_files: tuple[list[Path], list[Path]] | None = None,
+) -> list[QAFinding]:
     """Flag source files that use subprocess/file I/O without integration tests."""
     findings: list[QAFinding] = []
 
@@ -180,14 +206,11 @@ def check_integration_coverage(project_dir: Path) -> list[QAFinding]:
     if not src_dir.exists():
         return findings
 
-    test_files = _collect_test_files(project_dir)
-    has_tempdir_in_tests = any(
-        _TEMPDIR_PATTERN.search(tf.read_text(encoding="utf-8", errors="replace"))
-        for tf in test_files
-        if tf.exists()
-    )
+    test_texts = _test_texts if _test_texts is not None else _read_test_texts(project_dir)
+    has_tempdir_in_tests = any(_TEMPDIR_PATTERN.search(text) for text in test_texts.values())
 
-    for src_file in src_dir.rglob("*.py"):
+    py_files = _src_files[0] if _src_files is not None else _collect_src_files(src_dir)[0]
+    for src_file in py_files:
         try:
             content = src_file.read_text(encoding="utf-8", errors="replace")
         except OSError:
@@ -196,11 +219,7 @@ def check_integration_coverage(project_dir: Path) -> list[QAFinding]:
         if _SUBPROCESS_PATTERN.search(content):
             # Check for any integration test that exercises this module
             module_name = src_file.stem
-            tested = any(
-                module_name in tf.read_text(encoding="utf-8", errors="replace")
-                for tf in test_files
-                if tf.exists()
-            )
+            tested = any(module_name in text for text in test_texts.values())
             if not tested:
                 findings.append(
                     QAFinding(
@@ -230,24 +249,35 @@ _SEVERITY_SCORE = {"HIGH": 0.2, "MEDIUM": 0.1, "LOW": 0.05}
 def run_qa_check(project_dir: Path) -> QAReport:
     """Run all QA checks and return a QAReport with drift score."""
     findings: list[QAFinding] = []
-    findings.extend(find_untested_modules(project_dir))
-    findings.extend(check_mock_usage(project_dir))
-    findings.extend(check_false_confidence(project_dir))
-    findings.extend(check_integration_coverage(project_dir))
-
-    score = min(1.0, sum(_SEVERITY_SCORE.get(f.severity, 0.0) for f in findings))
-
     src_dir = project_dir / "src"
-    all_py = list(src_dir.rglob("*.py")) if src_dir.exists() else []
-    untested_files = {f.file for f in findings if f.category == "coverage-gap"}
+    src_files = _collect_src_files(src_dir) if src_dir.exists() else ([], [])
+    test_texts = _read_test_texts(project_dir)
+    findings.extend(find_untested_modules(project_dir, _src_files=src_files))
+    findings.extend(check_mock_usage(project_dir, _test_texts=test_texts))
+    findings.extend(check_false_confidence(project_dir, _test_texts=test_texts))
+    findings.extend(check_integration_coverage(project_dir, _test_texts=test_texts, _src_files=src_files))
+
+    # One pass over the findings for score, severity tallies, and category stats.
+    raw_score = 0.0
+    severity_counts: Counter[str] = Counter()
+    mock_count = 0
+    untested_files: set[str] = set()
+    for f in findings:
+        raw_score += _SEVERITY_SCORE.get(f.severity, 0.0)
+        severity_counts[f.severity] += 1
+        if f.category == "coverage-gap":
+            untested_files.add(f.file)
+        elif f.category == "mock-violation":
+            mock_count += 1
+    score = min(1.0, raw_score)
+
+    all_py = src_files[0]
     modules_untested = len(untested_files)
     modules_tested = max(0, len(all_py) - modules_untested)
 
-    mock_count = sum(1 for f in findings if f.category == "mock-violation")
-
-    high = sum(1 for f in findings if f.severity == "HIGH")
-    medium = sum(1 for f in findings if f.severity == "MEDIUM")
-    low = sum(1 for f in findings if f.severity == "LOW")
+    high = severity_counts["HIGH"]
+    medium = severity_counts["MEDIUM"]
+    low = severity_counts["LOW"]
     summary = f"{len(findings)} findings: {high} HIGH, {medium} MEDIUM, {low} LOW"
 
     return QAReport(
@@ -262,24 +292,23 @@ def run_qa_check(project_dir: Path) -> QAReport:
 
 def format_report(report: QAReport) -> str:
     """Format a QAReport as a human-readable string grouped by category."""
-    lines: list[str] = []
-    lines.append(f"QA Drift Report — score: {report.drift_score:.2f}")
-    lines.append(f"Modules tested: {report.modules_tested}  untested: {report.modules_untested}")
-    lines.append(f"Mock violations: {report.mock_count}")
-    lines.append(f"Summary: {report.summary}")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"QA Drift Report — score: {report.drift_score:.2f}\n")
+    w(f"Modules tested: {report.modules_tested}  untested: {report.modules_untested}\n")
+    w(f"Mock violations: {report.mock_count}\n")
+    w(f"Summary: {report.summary}\n")
 
     by_category: dict[str, list[QAFinding]] = {}
     for finding in report.findings:
         by_category.setdefault(finding.category, []).append(finding)
 
     for category, items in sorted(by_category.items()):
-        lines.append(f"[{category}]")
+        w(f"\n[{category}]\n")
         for item in items:
-            lines.append(f"  [{item.severity}] {item.file}: {item.description}")
-        lines.append("")
+            w(f"  [{item.severity}] {item.file}: {item.description}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 _PROGRAM_SEVERITY_RANK = {
@@ -14,6 +14,11 @@ from pathlib import Path
 from typing import Any
 
 
+_CLAUDE_BIN_RE = re.compile(r"(?:^|\s|/)claude(?:\s|$)")
+_STREAM_JSON_INPUT_RE = re.compile(r"(?:^|\s)--input-format(?:=|\s+)stream-json(?:\s|$)")
+_TASK_ARG_RE = re.compile(r"(?:^|\s)--task(?:=|\s+)(\S+)")
+
+
 @dataclass(frozen=True)
 class ProcessInfo:
     pid: int
@@ -70,12 +75,12 @@ def parse_claude_processes(lines: list[str], *, min_age_seconds: int) -> list[Pr
         elapsed_seconds = _parse_elapsed(elapsed_text)
         if elapsed_seconds is None or elapsed_seconds < min_age_seconds:
             continue
-        if "--print" not in cmdline or not re.search(r"(?:^|\s|/)claude(?:\s|$)", cmdline):
+        if "--print" not in cmdline or not _CLAUDE_BIN_RE.search(cmdline):
             continue
         # The coordinator speaks the stream-json protocol and must never be reaped.
-        if re.search(r"(?:^|\s)--input-format(?:=|\s+)stream-json(?:\s|$)", cmdline):
+        if _STREAM_JSON_INPUT_RE.search(cmdline):
             continue
-        task_match = re.search(r"(?:^|\s)--task(?:=|\s+)(\S+)", cmdline)
+        task_match = _TASK_ARG_RE.search(cmdline)
         processes.append(
             ProcessInfo(
                 pid=pid,
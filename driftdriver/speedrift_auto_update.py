@@ -7,8 +7,6 @@ import subprocess
 from pathlib import Path
 from typing import Any, Callable
 
-from driftdriver.install import refresh_existing_managed_surfaces
-
 
 RefreshFn = Callable[[Path, Path], dict[str, bool]]
 
@@ -108,7 +106,7 @@ def auto_update_for_repo_changes(
     project_dir: Path,
     wg_dir: Path,
     *,
-    refresher: RefreshFn = refresh_existing_managed_surfaces,
+    refresher: RefreshFn | None = None,
 ) -> dict[str, Any]:
     """Refresh Speedrift-managed guidance when the repository has changed.
 
@@ -141,6 +139,8 @@ def auto_update_for_repo_changes(
             "state_path": str(state_path),
         }
 
+    if refresher is None:
+        from driftdriver.install import refresh_existing_managed_surfaces as refresher
     refresh_result = refresher(project_dir, wg_dir)
     refreshed = any(bool(value) for value in refresh_result.values())
     final_signature = repo_change_signature(project_dir)
@@ -255,7 +255,8 @@ def _iter_marked_classes(project_dir: Path):
     ``class_source`` is the source text of the class body, for Layer 2 judgment."""
     for path in walk_py_files(project_dir):
         text = read_py_source(path)
-        if text is None:
+        # A marked class must spell the marker somewhere; skip the parse otherwise.
+        if text is None or (MARKER_NAME not in text and MARKER_BASE_PREFIX not in text):
             continue
         try:
             tree = ast.parse(text, filename=str(path))
@@ -0,0 +1,208 @@
+# ABOUTME: Tests for optional-plugin command planning and concurrent subprocess launch in cmd_check.
+# ABOUTME: Covers _optional_plugin_cmd gating, _run_subprocesses result shape and log-writer gating.
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from driftdriver.cli.check import (
+    _mode_flags,
+    _optional_plugin_cmd,
+    _parse_plugin_stdout,
+    _present_wrappers,
+    _replay_plugin_text,
+    _run_subprocesses,
+    _run_subprocesses_gated,
+    _task_fences,
+)
+
+
+def _plan(wg_dir: Path, project_dir: Path, *, plugin: str = "specdrift", enabled: bool = True, want_json: bool = True):
+    return _optional_plugin_cmd(
+        plugin=plugin,
+        enabled=enabled,
+        wg_dir=wg_dir,
+        project_dir=project_dir,
+        task_id="t1",
+        mode="observe",
+        force_write_log=False,
+        want_json=want_json,
+    )
+
+
+def test_plugin_cmd_none_when_bin_missing_or_disabled(tmp_path: Path) -> None:
+    wg_dir = tmp_path / ".workgraph"
+    wg_dir.mkdir()
+    assert _plan(wg_dir, tmp_path) is None
+    (wg_dir / "specdrift").write_text("#!/bin/sh\n", encoding="utf-8")
+    assert _plan(wg_dir, tmp_path, enabled=False) is None
+
+
+def test_plugin_cmd_json_flag_follows_mode(tmp_path: Path) -> None:
+    wg_dir = tmp_path / ".workgraph"
+    wg_dir.mkdir()
+    (wg_dir / "specdrift").write_text("#!/bin/sh\n", encoding="utf-8")
+    json_cmd = _plan(wg_dir, tmp_path, want_json=True)
+    text_cmd = _plan(wg_dir, tmp_path, want_json=False)
+    assert json_cmd is not None and "--json" in json_cmd
+    assert text_cmd is not None and "--json" not in text_cmd
+    assert json_cmd[-3:] == ["check", "--task", "t1"]
+
+
+def test_present_wrappers_lists_files_only(tmp_path: Path) -> None:
+    (tmp_path / "dirplugin").mkdir()
+    (tmp_path / "specdrift").write_text("#!/bin/sh\n", encoding="utf-8")
+    assert _present_wrappers(tmp_path) == frozenset({"specdrift"})
+    assert _present_wrappers(tmp_path / "missing") == frozenset()
+
+
+def test_plugin_cmd_uses_prescanned_presence(tmp_path: Path) -> None:
+    wg_dir = tmp_path / ".workgraph"
+    wg_dir.mkdir()
+    (wg_dir / "specdrift").write_text("#!/bin/sh\n", encoding="utf-8")
+    cmd = _optional_plugin_cmd(
+        plugin="specdrift",
+        enabled=True,
+        wg_dir=wg_dir,
+        project_dir=tmp_path,
+        task_id="t1",
+        mode="observe",
+        force_write_log=False,
+        want_json=True,
+        present=frozenset(),
+    )
+    assert cmd is None
+
+
+def test_run_subprocesses_returns_completed_processes_by_key() -> None:
+    cmds = {
+        "ok": [sys.executable, "-c", "print('{\"a\": 1}')"],
+        "fail": [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"],
+    }
+    procs = asyncio.run(_run_subprocesses(cmds))
+    assert list(procs) == ["ok", "fail"]
+    assert procs["ok"].returncode == 0
+    assert procs["ok"].stdout.strip() == '{"a": 1}'
+    assert procs["fail"].returncode == 3
+    assert procs["fail"].stderr == "boom"
+
+
+def test_run_subprocesses_caps_stderr_but_drains_it() -> None:
+    cmds = {
+        "noisy": [sys.executable, "-c", "import sys; sys.stderr.write('x' * 200000); print('done')"],
+    }
+    procs = asyncio.run(_run_subprocesses(cmds, stderr_limits={"noisy": 100}))
+    assert procs["noisy"].returncode == 0
+    assert procs["noisy"].stdout.strip() == "done"
+    assert procs["noisy"].stderr == "x" * 100
+
+
+def _gated_cmds(tmp_path: Path, gate_rc: int) -> dict[str, list[str]]:
+    marker = tmp_path / "writer-ran"
+    return {
+        "coredrift": [sys.executable, "-c", f"import sys; sys.exit({gate_rc})"],
+        "reader": [sys.executable, "-c", "print('read')"],
+        "writer": [sys.executable, "-c", f"open({str(marker)!r}, 'w').write('x')"],
+    }
+
+
+def test_run_subprocesses_gated_skips_deferred_when_gate_fails(tmp_path: Path) -> None:
+    procs = asyncio.run(
+        _run_subprocesses_gated(
+            _gated_cmds(tmp_path, 2), gate="coredrift", deferred=frozenset({"writer"}), ok_codes=(0, 3)
+        )
+    )
+    assert procs["coredrift"].returncode == 2
+    assert procs["reader"].stdout.strip() == "read"
+    assert "writer" not in procs
+    assert not (tmp_path / "writer-ran").exists()
+
+
+def test_run_subprocesses_gated_runs_deferred_after_gate_succeeds(tmp_path: Path) -> None:
+    procs = asyncio.run(
+        _run_subprocesses_gated(
+            _gated_cmds(tmp_path, 3), gate="coredrift", deferred=frozenset({"writer"}), ok_codes=(0, 3)
+        )
+    )
+    assert set(procs) == {"coredrift", "reader", "writer"}
+    assert procs["writer"].returncode == 0
+    assert (tmp_path / "writer-ran").exists()
+
+
+def test_parse_plugin_stdout_shapes() -> None:
+    assert _parse_plugin_stdout("") == {}
+    assert _parse_plugin_stdout(None) == {}
+    assert _parse_plugin_stdout(' {"ok": true}\n') == {"ok": True}
+    assert _parse_plugin_stdout("not json") == {"raw": "not json"}
+    assert _parse_plugin_stdout("{broken") == {"raw": "{broken"}
+    assert _parse_plugin_stdout("  \n") == {"raw": "  \n"}
+
+
+def test_replay_plugin_text_writes_output_and_maps_exit_codes(capsys: pytest.CaptureFixture[str]) -> None:
+    assert _replay_plugin_text(plugin="specdrift", proc=None) == 0
+    findings = subprocess.CompletedProcess(["specdrift"], 3, "spec findings\n", "")
+    assert _replay_plugin_text(plugin="specdrift", proc=findings) == 3
+    crashed = subprocess.CompletedProcess(["datadrift"], 1, "", "trace\n")
+    assert _replay_plugin_text(plugin="datadrift", proc=crashed) == 0
+    captured = capsys.readouterr()
+    assert captured.out == "spec findings\n"
+    assert "trace" in captured.err
+    assert "note: datadrift failed (exit 1); continuing" in captured.err
+
+
+def test_replay_plugin_text_keeps_order_through_a_shared_pipe() -> None:
+    # Replay in a child whose stdout and stderr share one pipe (like 2>&1), so
+    # stdout is block-buffered while stderr is not.
+    script = (
+        "import subprocess\n"
+        "from driftdriver.cli.check import _replay_plugin_text\n"
+        "_replay_plugin_text(plugin='a', proc=subprocess.CompletedProcess(['a'], 0, 'a-out\\n', 'a-err\\n'))\n"
+        "_replay_plugin_text(plugin='b', proc=subprocess.CompletedProcess(['b'], 3, 'b-out\\n', 'b-err\\n'))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[1],
+        env={k: v for k, v in os.environ.items() if k != "PYTHONUNBUFFERED"},
+    )
+    assert proc.stdout.splitlines() == ["a-out", "a-err", "b-out", "b-err"]
+
+
+def test_task_fences_matches_declared_fences_only() -> None:
+    task = {"description": "notes\n```specdrift\nx\n```\n```uxdrift\ny\n```"}
+    assert _task_fences(task=task, candidates=["specdrift", "datadrift", "uxdrift"]) == {"specdrift", "uxdrift"}
+    assert _task_fences(task={"description": "no fences"}, candidates=["specdrift"]) == set()
+    assert _task_fences(task=None, candidates=["specdrift"]) == set()
+
+
+def test_task_fences_reports_each_fence_once_across_repeats() -> None:
+    task = {"description": "```specdrift\na\n```\n```specdrift\nb\n```\n```redrift\n```"}
+    assert _task_fences(task=task, candidates=("redrift",)) == {"redrift"}
+    assert _task_fences(task=task, candidates=["specdrift", "redrift"]) == {"specdrift", "redrift"}
+    assert _task_fences(task=task, candidates=[]) == set()
+
+
+@pytest.mark.parametrize(
+    "mode,plugin,expected",
+    [
+        ("observe", "specdrift", (False, False)),
+        (" Advise ", "specdrift", (True, False)),
+        ("redirect", "coredrift", (True, True)),
+        ("heal", "specdrift", (True, False)),
+        ("heal", "therapydrift", (True, True)),
+        ("breaker", "therapydrift", (True, False)),
+        ("", "specdrift", (True, True)),
+        ("unknown", "specdrift", (True, True)),
+    ],
+)
+def test_mode_flags_table(mode: str, plugin: str, expected: tuple[bool, bool]) -> None:
+    assert _mode_flags(mode=mode, plugin=plugin) == expected
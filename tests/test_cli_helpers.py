@@ -15,6 +15,9 @@ from driftdriver.cli._helpers import (
     _compute_loop_safety,
     _dedupe_strings,
     _ensure_update_followup_task,
+    _find_wg_dir,
+    _load_policy_cached,
+    _load_wg_cached,
     _maybe_auto_ensure_contracts,
     _normalize_actions,
     _parse_watch_repo,
@@ -27,6 +30,87 @@ from driftdriver.cli._helpers import (
 )
 
 
+# ---------------------------------------------------------------------------
+# _find_wg_dir
+# ---------------------------------------------------------------------------
+
+
+class TestFindWgDir:
+    def test_resolves_and_memoizes_explicit_dir(self, tmp_path: Path) -> None:
+        wg = tmp_path / ".workgraph"
+        wg.mkdir()
+        (wg / "graph.jsonl").write_text("", encoding="utf-8")
+        first = _find_wg_dir(str(tmp_path))
+        assert first == wg
+        assert _find_wg_dir(str(tmp_path)) is first
+
+    def test_missing_workgraph_raises_and_is_not_cached(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        with pytest.raises(FileNotFoundError):
+            _find_wg_dir(tmp_path)
+        wg = tmp_path / ".workgraph"
+        wg.mkdir()
+        (wg / "graph.jsonl").write_text("", encoding="utf-8")
+        assert _find_wg_dir(tmp_path) == wg
+
+    def test_removed_graph_triggers_fresh_lookup(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        child = tmp_path / "child"
+        for root in (tmp_path, child):
+            (root / ".workgraph").mkdir(parents=True)
+            (root / ".workgraph" / "graph.jsonl").write_text("", encoding="utf-8")
+        assert _find_wg_dir(child) == child / ".workgraph"
+        (child / ".workgraph" / "graph.jsonl").unlink()
+        assert _find_wg_dir(child) == tmp_path / ".workgraph"
+
+    def test_wg_init_invalidates_cached_parent(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        from driftdriver.cli import check
+
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".workgraph").mkdir()
+        (tmp_path / ".workgraph" / "graph.jsonl").write_text("", encoding="utf-8")
+        child = tmp_path / "child"
+        child.mkdir()
+        assert _find_wg_dir(child) == tmp_path / ".workgraph"
+
+        def fake_init(cmd: list[str], cwd: str) -> int:
+            wg_dir = Path(cmd[2])
+            wg_dir.mkdir()
+            (wg_dir / "graph.jsonl").write_text("", encoding="utf-8")
+            return 0
+
+        monkeypatch.setattr(check.subprocess, "check_call", fake_init)
+        check._ensure_wg_init(child)
+        assert _find_wg_dir(child) == child / ".workgraph"
+
+
+class TestLoadWgCached:
+    def test_reuses_parse_until_graph_changes(self, tmp_path: Path) -> None:
+        wg = tmp_path / ".workgraph"
+        wg.mkdir()
+        graph = wg / "graph.jsonl"
+        graph.write_text(json.dumps({"kind": "task", "id": "t1"}) + "\n", encoding="utf-8")
+        first = _load_wg_cached(wg)
+        assert _load_wg_cached(wg) is first
+        graph.write_text(
+            json.dumps({"kind": "task", "id": "t1"}) + "\n" + json.dumps({"kind": "task", "id": "t2"}) + "\n",
+            encoding="utf-8",
+        )
+        assert set(_load_wg_cached(wg).tasks) == {"t1", "t2"}
+
+
+class TestLoadPolicyCached:
+    def test_reuses_policy_until_file_changes(self, tmp_path: Path) -> None:
+        wg = tmp_path / ".workgraph"
+        wg.mkdir()
+        default = _load_policy_cached(wg)
+        assert _load_policy_cached(wg) is default
+        (wg / "drift-policy.toml").write_text('schema = 1\nmode = "observe"\n', encoding="utf-8")
+        updated = _load_policy_cached(wg)
+        assert updated.mode == "observe"
+        assert _load_policy_cached(wg) is updated
+
+
 # ---------------------------------------------------------------------------
 # _update_errors
 # ---------------------------------------------------------------------------
@@ -15,6 +15,7 @@ import pytest
 from driftdriver.cli.check import ExitCode
 from driftdriver.cli.run import (
     _invoke_check_json,
+    _unwrap_pinned_wrapper,
     cmd_orchestrate,
     cmd_run,
 )
@@ -395,4 +396,35 @@ class TestCmdOrchestrate:
         rc = cmd_orchestrate(args)
         assert rc == 42
 
+    def test_pinned_wrapper_invokes_target_directly(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from driftdriver.install import write_tool_wrapper
+
+        wg = _make_workgraph_dir(tmp_path)
+        real_bin = tmp_path / "real-coredrift"
+        real_bin.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+        real_bin.chmod(0o755)
+        write_tool_wrapper(wg, tool_name="coredrift", tool_bin=real_bin)
+
+        captured_cmds: list[list[str]] = []
+        monkeypatch.setattr("driftdriver.cli.run._run", lambda cmd: captured_cmds.append(cmd) or 0)
+
+        args = argparse.Namespace(
+            dir=str(tmp_path),
+            interval=30,
+            redirect_interval=60,
+            write_log=False,
+            create_followups=False,
+        )
+        assert cmd_orchestrate(args) == 0
+        assert captured_cmds[0][0] == str(real_bin)
 
+    def test_unwrap_leaves_portable_or_dangling_wrappers(self, tmp_path: Path) -> None:
+        from driftdriver.install import write_tool_wrapper
+
+        wg = _make_workgraph_dir(tmp_path)
+        write_tool_wrapper(wg, tool_name="coredrift", tool_bin=tmp_path / "missing")
+        assert _unwrap_pinned_wrapper(wg / "coredrift") == wg / "coredrift"
+        write_tool_wrapper(wg, tool_name="coredrift", tool_bin=tmp_path / "missing", wrapper_mode="portable")
+        assert _unwrap_pinned_wrapper(wg / "coredrift") == wg / "coredrift"
@@ -1,6 +1,8 @@
 # ABOUTME: Tests for cold distillation engine - Lessons MCP data maintenance
 # ABOUTME: Covers event clustering, summarization, pattern finding, pruning, and full pipeline
 
+import pytest
+
 from driftdriver.cold_distillation import (
     DistillationResult,
     apply_decay,
@@ -59,6 +61,13 @@ def test_cluster_events_missing_event_type():
     assert "unknown" in result
 
 
+def test_cluster_events_missing_lookup_raises_key_error():
+    clusters = cluster_events([{"event_type": "decision"}])
+    with pytest.raises(KeyError):
+        clusters["error"]
+    assert "error" not in clusters
+
+
 # ---------------------------------------------------------------------------
 # test_summarize_cluster_requires_minimum
 # ---------------------------------------------------------------------------
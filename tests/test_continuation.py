@@ -26,6 +26,16 @@ class EvaluateContinuationTests(unittest.TestCase):
         self.assertEqual(decision.action, "CONTINUE")
         self.assertFalse(decision.throttled)
 
+    def test_stop_when_checklist_complete(self) -> None:
+        contract = {
+            "status": "in_progress",
+            "checklist": ["item1", "item2", "item1"],
+            "checklist_done": ["item2", "extra", "item1"],
+        }
+        decision = evaluate_continuation(contract, recent_actions=[], stop_reason="agent_stop")
+        self.assertEqual(decision.action, "STOP")
+        self.assertEqual(decision.reason, "Checklist fully complete")
+
     def test_stop_when_no_active_task(self) -> None:
         decision = evaluate_continuation({}, recent_actions=[], stop_reason="agent_stop")
         self.assertEqual(decision.action, "STOP")
@@ -90,6 +100,23 @@ class ThrottleTests(unittest.TestCase):
             throttled = check_throttle(state_dir, window_seconds=300, max_continuations=3)
         self.assertTrue(throttled)
 
+    def test_record_continuation_compacts_stale_history(self) -> None:
+        with TemporaryDirectory() as tmp:
+            state_dir = Path(tmp)
+            state_file = state_dir / ".continuation-state"
+            old = time.time() - 7200
+            state_file.write_text("".join(f"{old + i}\n" for i in range(100)) + "junk\n")
+            self.assertFalse(check_throttle(state_dir, window_seconds=300, max_continuations=3))
+            # check_throttle is read-only; only recording compacts.
+            self.assertEqual(len(state_file.read_text().splitlines()), 101)
+            record_continuation(state_dir)
+            self.assertEqual(len(state_file.read_text().splitlines()), 1)
+            record_continuation(state_dir)
+            self.assertFalse(check_throttle(state_dir, window_seconds=300, max_continuations=3))
+            record_continuation(state_dir)
+            self.assertTrue(check_throttle(state_dir, window_seconds=300, max_continuations=3))
+            self.assertEqual(sorted(p.name for p in state_dir.iterdir()), [".continuation-state"])
+
     def test_check_throttle_non_numeric_lines(self) -> None:
         with TemporaryDirectory() as tmp:
             state_dir = Path(tmp)
@@ -61,6 +61,18 @@ def test_find_relevant_learnings_returns_no_more_than_max_entries():
     assert len(results) <= 2
 
 
+def test_find_relevant_learnings_keeps_input_order_for_ties():
+    entries = [
+        {"content": "alpha one"},
+        {"content": "alpha beta two"},
+        {"content": "alpha three"},
+        {"content": "alpha beta four"},
+    ]
+    results = find_relevant_learnings("alpha beta", entries, max_entries=3)
+
+    assert [r["content"] for r in results] == ["alpha beta two", "alpha beta four", "alpha one"]
+
+
 # ---------------------------------------------------------------------------
 # test_find_relevant_learnings_empty_when_no_match
 # ---------------------------------------------------------------------------
@@ -101,6 +101,59 @@ class TestGuardedAddDriftTask(unittest.TestCase):
             )
         self.assertEqual(result, "existing")
 
+    def test_existing_task_in_graph_skips_wg_show(self) -> None:
+        """A task already in graph.jsonl is deduped without shelling out."""
+        (self.wg_dir / "graph.jsonl").write_text(
+            json.dumps({"kind": "task", "id": "qadrift-abc", "status": "open"}) + "\n"
+        )
+        with patch("driftdriver.drift_task_guard._run_wg") as mock:
+            result = guarded_add_drift_task(
+                wg_dir=self.wg_dir,
+                task_id="qadrift-abc",
+                title="test",
+                description="test desc",
+                lane_tag="qadrift",
+            )
+        self.assertEqual(result, "existing")
+        mock.assert_not_called()
+
+    def test_hung_wg_list_returns_error_not_uncapped(self) -> None:
+        """A readable graph skips wg show; a timed-out wg list must not bypass budgets."""
+        (self.wg_dir / "graph.jsonl").write_text(
+            json.dumps({"kind": "task", "id": "other", "status": "open"}) + "\n"
+        )
+
+        def mock_run(cmd, *, cwd=None, timeout=40.0):
+            if "list" in cmd:
+                return (1, "", f"Command {cmd!r} timed out after {timeout} seconds")
+            return (1, "", "")
+
+        with patch("driftdriver.drift_task_guard._run_wg", side_effect=mock_run), \
+             patch("driftdriver.executor_shim.subprocess.run") as sub:
+            result = guarded_add_drift_task(
+                wg_dir=self.wg_dir,
+                task_id="qadrift-new",
+                title="new finding",
+                description="desc",
+                lane_tag="qadrift",
+            )
+        self.assertEqual(result, "error")
+        sub.assert_not_called()
+
+    def test_non_object_graph_line_falls_back_to_wg_show(self) -> None:
+        (self.wg_dir / "graph.jsonl").write_text("[1, 2]\n")
+        with patch("driftdriver.drift_task_guard._run_wg") as mock:
+            mock.return_value = (0, '{"id": "qadrift-abc"}', "")
+            result = guarded_add_drift_task(
+                wg_dir=self.wg_dir,
+                task_id="qadrift-abc",
+                title="test",
+                description="test desc",
+                lane_tag="qadrift",
+            )
+        self.assertEqual(result, "existing")
+        self.assertIn("show", mock.call_args.args[0])
+
     def test_capped_returns_capped(self) -> None:
         """If active drift tasks >= budget max_active_tasks, return 'capped'."""
         tasks = [
@@ -11,6 +11,7 @@ from driftdriver.event_bridge import (
     bridge_events,
     filter_federated_knowledge,
     format_mcp_call,
+    iter_events_file,
     map_event,
     match_scope_relevance,
     parse_events_file,
@@ -57,6 +58,27 @@ def test_parse_events_file_handles_malformed_lines():
     assert events[1]["event"] == "session_start"
 
 
+def test_parse_events_file_skips_undecodable_lines(tmp_path):
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_bytes(
+        b'{"event": "stop", "note": "caf\xc3\xa9"}\r\n'
+        b"\xff\xfe not utf-8\n"
+        b"   \n"
+        b'{"event": "session_start"}'
+    )
+    events = parse_events_file(events_file)
+    assert [e["event"] for e in events] == ["stop", "session_start"]
+    assert events[0]["note"] == "caf\u00e9"
+
+
+def test_iter_events_file_yields_lazily(tmp_path):
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text('{"event": "stop"}\nbad\n{"event": "session_end"}\n')
+    it = iter_events_file(events_file)
+    assert next(it) == {"event": "stop"}
+    assert [e["event"] for e in it] == ["session_end"]
+
+
 def test_bridge_events_filters_none():
     with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
         f.write('{"event": "pre_tool_use", "ts": "2026-01-15T10:30:00Z", "tool": "Read", "tool_input": {}}\n')
@@ -30,6 +30,12 @@ class HealthTests(unittest.TestCase):
         self.assertTrue(is_active(drift_task))
         self.assertEqual(redrift_depth("redrift-build-redrift-app"), 2)
 
+    def test_detects_drift_word_in_title(self) -> None:
+        self.assertTrue(is_drift_task({"id": "t1", "title": "Review Drift in api"}))
+        self.assertTrue(is_drift_task({"id": "t2", "title": "DRİFT review"}))
+        self.assertFalse(is_drift_task({"id": "t3", "title": "Adrift roadmap"}))
+        self.assertFalse(is_drift_task({"id": "my-drift-x", "title": "Feature"}))
+
     def test_blockers_done_and_cycle_detection(self) -> None:
         tasks = {
             "a": {"id": "a", "status": "done"},
@@ -42,6 +48,23 @@ class HealthTests(unittest.TestCase):
         self.assertTrue(detect_cycle_from("c", tasks))
         self.assertFalse(detect_cycle_from("b", tasks))
 
+    def test_cycle_detection_handles_deep_chains(self) -> None:
+        depth = 5000
+        tasks = {f"t{i}": {"id": f"t{i}", "blocked_by": [f"t{i + 1}"]} for i in range(depth)}
+        self.assertFalse(detect_cycle_from("t0", tasks))
+        tasks[f"t{depth - 1}"]["blocked_by"] = ["t0"]
+        self.assertTrue(detect_cycle_from("t0", tasks))
+
+    def test_cycle_detection_ignores_shared_blockers(self) -> None:
+        # Diamond: two paths reach "d", which is not a cycle.
+        tasks = {
+            "a": {"id": "a", "blocked_by": ["b", "c"]},
+            "b": {"id": "b", "blocked_by": ["d"]},
+            "c": {"id": "c", "blocked_by": ["d"]},
+            "d": {"id": "d"},
+        }
+        self.assertFalse(detect_cycle_from("a", tasks))
+
     def test_blockers_done_no_blockers(self) -> None:
         """Task with no blocked_by should return True — nothing is blocking it."""
         no_blocker_task: dict = {"id": "free", "status": "open"}
@@ -104,6 +127,41 @@ class HealthTests(unittest.TestCase):
         self.assertEqual(dups[0]["key"], "app")
         self.assertEqual(dups[0]["count"], 2)
 
+    def test_ready_queue_priorities(self) -> None:
+        tasks = [
+            {"id": "drift-breaker-a", "title": "missing_contract", "status": "open"},
+            {"id": "coredrift-pit-a", "title": "pit", "status": "open"},
+            {"id": "drift-harden-a", "title": "harden: missing_contract", "status": "open"},
+            {"id": "drift-fix-a", "title": "fix", "status": "open"},
+            {"id": "redrift-build-a", "title": "redrift build", "status": "open"},
+            {"id": "drift-harden", "title": "harden", "status": "open"},
+        ]
+        ranked = rank_ready_drift_queue(tasks, limit=10)
+        self.assertEqual(
+            [(row["task_id"], row["priority"]) for row in ranked],
+            [
+                ("drift-breaker-a", 100),
+                ("coredrift-pit-a", 90),
+                ("drift-harden-a", 85),
+                ("drift-fix-a", 75),
+                ("redrift-build-a", 60),
+                ("drift-harden", 50),
+            ],
+        )
+
+    def test_duplicate_groups_keep_every_member_in_order(self) -> None:
+        tasks = [
+            {"id": "drift-fix-1", "title": "Fix A", "status": "open"},
+            {"id": "drift-fix-2", "title": "fix  a", "status": "open"},
+            {"id": "drift-fix-3", "title": "Fix B", "status": "open"},
+            {"id": "drift-fix-4", "title": "FIX A", "status": "open"},
+        ]
+        dups = find_duplicate_open_drift_groups(tasks)
+        self.assertEqual(
+            dups,
+            [{"key": "fix a", "count": 3, "task_ids": ["drift-fix-1", "drift-fix-2", "drift-fix-4"]}],
+        )
+
     def test_scoreboard_status_progression(self) -> None:
         healthy = [
             {"id": "a", "status": "done", "description": "```wg-contract\nx\n```"},
@@ -122,6 +180,25 @@ class HealthTests(unittest.TestCase):
         self.assertEqual(healthy_score["status"], "healthy")
         self.assertEqual(risk_score["status"], "risk")
 
+    def test_scoreboard_counts(self) -> None:
+        tasks = [
+            {"id": "task-1", "status": "open", "description": "```wg-contract\nx\n```"},
+            {"id": "task-2", "status": "done"},
+            {"id": "drift-fix-a", "title": "fix a", "status": "open", "blocked_by": ["task-1"]},
+            {"id": "drift-fix-b", "title": "fix b", "status": "open", "blocked_by": ["task-2"]},
+            {"id": "drift-fix-c", "title": "fix c", "status": "done"},
+        ]
+
+        score = compute_scoreboard(tasks)
+
+        self.assertEqual(score["tasks_total"], 5)
+        self.assertEqual(score["active_tasks"], 3)
+        self.assertEqual(score["drift_total"], 3)
+        self.assertEqual(score["active_drift"], 2)
+        # drift-fix-a waits on the open non-drift task-1.
+        self.assertEqual(score["ready_drift"], 1)
+        self.assertEqual(score["active_contract_coverage"], round(1 / 3, 4))
+
 
 if __name__ == "__main__":
     unittest.main()
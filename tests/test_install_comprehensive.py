@@ -38,6 +38,7 @@ from driftdriver.install import (
     ensure_depsdrift_gitignore,
     ensure_executor_guidance,
     ensure_fixdrift_gitignore,
+    ensure_gitignore_entries,
     ensure_qadrift_gitignore,
     ensure_redrift_gitignore,
     ensure_specdrift_gitignore,
@@ -228,6 +229,15 @@ class TestEnsureGitignore:
         assert ".specdrift/" in content
         assert ".uxdrift/" in content
 
+    def test_batched_entries_single_write(self, tmp_path: Path) -> None:
+        wg_dir = tmp_path / ".workgraph"
+        wg_dir.mkdir()
+        ensure_coredrift_gitignore(wg_dir)
+        assert ensure_gitignore_entries(wg_dir, [".coredrift/", ".qadrift/", ".redrift/", ".qadrift/"]) is True
+        assert ensure_gitignore_entries(wg_dir, [".coredrift/", ".qadrift/"]) is False
+        content = (wg_dir / ".gitignore").read_text(encoding="utf-8")
+        assert content == ".coredrift/\n.qadrift/\n.redrift/\n"
+
     def test_creates_parent_dir_if_missing(self, tmp_path: Path) -> None:
         """_ensure_line_in_file creates parent dirs as needed."""
         wg_dir = tmp_path / "deep" / "nested" / ".workgraph"
@@ -276,6 +286,19 @@ class TestWriteToolWrapper:
         changed = write_tool_wrapper(wg_dir, tool_name="mytool", tool_bin=fake_bin)
         assert changed is False
 
+    def test_rerun_leaves_unchanged_wrapper_untouched(self, tmp_path: Path) -> None:
+        wg_dir = tmp_path / ".workgraph"
+        wg_dir.mkdir()
+        fake_bin = _make_fake_bin(tmp_path, "mytool")
+        write_tool_wrapper(wg_dir, tool_name="mytool", tool_bin=fake_bin)
+        wrapper = wg_dir / "mytool"
+        os.utime(wrapper, ns=(1_000_000_000, 1_000_000_000))
+        before = wrapper.stat()
+        write_tool_wrapper(wg_dir, tool_name="mytool", tool_bin=fake_bin)
+        after = wrapper.stat()
+        assert after.st_mtime_ns == before.st_mtime_ns
+        assert after.st_ctime_ns == before.st_ctime_ns
+
     def test_executable_bit_set(self, tmp_path: Path) -> None:
         wg_dir = tmp_path / ".workgraph"
         wg_dir.mkdir()
@@ -444,6 +467,25 @@ class TestResolveBin:
         result = resolve_bin(explicit=None, env_var=None, which_name=None, candidates=[])
         assert result is None
 
+    def test_which_lookup_keyed_on_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        _make_fake_bin(first, "pathtool")
+        fake_second = _make_fake_bin(second, "pathtool")
+        monkeypatch.setenv("PATH", str(first))
+        assert resolve_bin(explicit=None, env_var=None, which_name="pathtool", candidates=[]) == first / "pathtool"
+        monkeypatch.setenv("PATH", str(second))
+        assert resolve_bin(explicit=None, env_var=None, which_name="pathtool", candidates=[]) == fake_second
+
+    def test_which_miss_is_not_cached(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert resolve_bin(explicit=None, env_var=None, which_name="latetool", candidates=[]) is None
+        # Installed mid-process on the same PATH: the earlier miss must not stick.
+        fake = _make_fake_bin(tmp_path, "latetool")
+        assert resolve_bin(explicit=None, env_var=None, which_name="latetool", candidates=[]) == fake
+
 
 # ---------------------------------------------------------------------------
 # ensure_executor_guidance
@@ -298,6 +298,10 @@ class NorthstarDriftTests(unittest.TestCase):
             self.assertGreaterEqual(len(history["weekly_points"]), 2)
             self.assertIn("7d", history["windows"])
             self.assertIn("30d", history["windows"])
+            self.assertEqual(
+                [row["day"] for row in history["daily_points"]],
+                ["2026-02-25", "2026-03-06"],
+            )
 
     def test_emit_northstar_review_tasks_creates_local_followups(self) -> None:
         snapshot = _snapshot(
@@ -39,6 +39,20 @@ class QADriftTests(unittest.TestCase):
             self.assertTrue(any(f.category == "coverage-gap" for f in findings))
             self.assertTrue(any("mymodule" in f.file for f in findings))
 
+    def test_find_untested_modules_matches_ts_tests_anywhere_in_src(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_dir = Path(td)
+            (project_dir / "src" / "lib").mkdir(parents=True)
+            (project_dir / "src" / "__tests__").mkdir()
+            (project_dir / "src" / "lib" / "covered.ts").write_text("export const a = 1\n")
+            (project_dir / "src" / "__tests__" / "covered.test.ts").write_text("test('a', () => {})\n")
+            (project_dir / "src" / "lib" / "bare.ts").write_text("export const b = 2\n")
+            (project_dir / "src" / "lib" / "types.d.ts").write_text("export type T = number\n")
+
+            findings = find_untested_modules(project_dir)
+
+            self.assertEqual([f.file for f in findings], ["src/lib/bare.ts"])
+
     def test_check_mock_usage_finds_unittest_mock(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             project_dir = Path(td)
@@ -85,6 +99,33 @@ class QADriftTests(unittest.TestCase):
             self.assertTrue(any(f.category == "missing-integration" for f in findings))
             self.assertTrue(any("runner" in f.file for f in findings))
 
+    def test_check_integration_coverage_reads_each_test_file_once(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_dir = Path(td)
+            src_dir = project_dir / "src"
+            src_dir.mkdir()
+            for name in ("alpha", "beta", "gamma"):
+                (src_dir / f"{name}.py").write_text("import subprocess\n")
+            tests_dir = project_dir / "tests"
+            tests_dir.mkdir()
+            (tests_dir / "test_alpha.py").write_text("import alpha\ndef test_a(tmp_path): assert alpha\n")
+            (tests_dir / "test_other.py").write_text("def test_b(): assert 1\n")
+
+            real_read_text = Path.read_text
+            reads: list[str] = []
+
+            def counting_read_text(path: Path, *args, **kwargs) -> str:
+                reads.append(path.name)
+                return real_read_text(path, *args, **kwargs)
+
+            with patch.object(Path, "read_text", counting_read_text):
+                findings = check_integration_coverage(project_dir)
+
+            self.assertEqual(reads.count("test_alpha.py"), 1)
+            self.assertEqual(reads.count("test_other.py"), 1)
+            flagged = {f.file for f in findings if "subprocess" in f.description}
+            self.assertEqual(flagged, {"src/beta.py", "src/gamma.py"})
+
     def test_run_qa_check_calculates_score(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             project_dir = Path(td)
@@ -120,6 +161,29 @@ class QADriftTests(unittest.TestCase):
         self.assertIn("coverage-gap", output)
         self.assertIn("0.2", output)
 
+    def test_format_report_layout(self) -> None:
+        report = QAReport(
+            findings=[
+                QAFinding(file="b.py", category="mock-violation", severity="LOW", description="mock"),
+                QAFinding(file="a.py", category="coverage-gap", severity="HIGH", description="gap"),
+            ],
+            drift_score=0.5,
+            modules_tested=1,
+            modules_untested=1,
+            mock_count=1,
+            summary="2 findings",
+        )
+
+        self.assertEqual(
+            format_report(report),
+            "QA Drift Report — score: 0.50\n"
+            "Modules tested: 1  untested: 1\n"
+            "Mock violations: 1\n"
+            "Summary: 2 findings\n"
+            "\n[coverage-gap]\n  [HIGH] a.py: gap\n"
+            "\n[mock-violation]\n  [LOW] b.py: mock\n",
+        )
+
 
 class QADriftWrapperTests(unittest.TestCase):
     def test_qadrift_wrapper_no_cd(self) -> None:
@@ -82,6 +82,18 @@ def test_unmarked_class_ignored(tmp_path: Path) -> None:
     assert res.findings == []
 
 
+def test_files_without_marker_are_not_parsed(tmp_path: Path, monkeypatch) -> None:
+    _write(tmp_path, "plain.py", "class PlainError:\n    pass\n")
+    parsed: list[str] = []
+    real_parse = surfacedrift.ast.parse
+    monkeypatch.setattr(
+        surfacedrift.ast, "parse",
+        lambda text, filename="<unknown>", **kw: parsed.append(filename) or real_parse(text, filename, **kw),
+    )
+    assert surfacedrift.run_as_lane(tmp_path).findings == []
+    assert parsed == []
+
+
 def test_no_marked_surfaces_is_clean(tmp_path: Path) -> None:
     # A repo with no model-operable surfaces is not flagged — surfacedrift is opt-in.
     _write(tmp_path, "app.py",
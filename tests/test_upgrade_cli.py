@@ -61,3 +61,18 @@ def test_parser_upgrade_help_text(tmp_path):
         except SystemExit:
             pass
     assert "upgrade" in buf.getvalue()
+
+
+def test_parser_selected_subcommand_matches_full_parser():
+    argv = ["--dir", "/tmp/x", "upgrade", "--dry-run"]
+    from driftdriver.cli import _peek_command
+
+    assert _peek_command(argv) == "upgrade"
+    assert _peek_command(["--help"]) is None
+    assert vars(_build_parser("upgrade").parse_args(argv)) == vars(_build_parser().parse_args(argv))
+
+
+def test_parser_unknown_selected_subcommand_falls_back_to_full_parser():
+    p = _build_parser("not-a-command")
+
+    assert p.parse_args(["upgrade"]).cmd == "upgrade"